@@ -86,6 +86,28 @@ class WfState:
         """Return custom name if set, otherwise default name."""
         return self.name if self.name else f"Waveform {self.id + 1}"
 
+    @property
+    def color(self) -> Tuple[int, int, int]:
+        """RGB color tuple (0-255 per channel)."""
+        return self._color
+
+    @color.setter
+    def color(self, value: Tuple[int, int, int]) -> None:
+        """Set RGB color and refresh the cached matplotlib and hex colors."""
+        self._color = value
+        self._mpl_color = (value[0] / 255, value[1] / 255, value[2] / 255)
+        self._hex_color = '#{:02x}{:02x}{:02x}'.format(*value)
+
+    @property
+    def mpl_color(self) -> Tuple[float, float, float]:
+        """Return color as a matplotlib RGB tuple (0.0-1.0 per channel)."""
+        return self._mpl_color
+
+    @property
+    def hex_color(self) -> str:
+        """Return color as a '#rrggbb' hex string."""
+        return self._hex_color
+
 
 class AppState:
     """Manages global application state."""
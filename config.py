@@ -7,10 +7,26 @@ Reads default settings from default.cfg (INI format).
 import configparser
 import os
 import sys
-from typing import Any
+from typing import Any, Optional
 
 CONFIG_FILENAME = "default.cfg"
 
+_DEFAULTS: dict[str, Any] = {
+    "duration": 10.0,
+    "frequency": 0.2,
+    "amplitude": 2.0,
+    "offset": 8.0,
+    "duty_cycle": 50.0,
+    "waveform_type": "sine",
+    "y_axis_title": "Amplitude",
+    "y_min": 0.0,
+    "y_max": 10.0,
+    "theme": "dark",
+}
+
+# Parsed settings, filled on first load and kept in sync by save_config
+_config_cache: Optional[dict[str, Any]] = None
+
 
 def _get_config_path() -> str:
     """Return path to default.cfg.
@@ -28,22 +44,22 @@ def _get_config_path() -> str:
 def load_config() -> dict[str, Any]:
     """Load configuration from default.cfg.
 
+    The file is only read on the first call; later calls return a copy
+    of the cached settings.
+
     Returns:
         Dict of configuration values. Missing or invalid keys fall back
         to built-in defaults.
     """
-    defaults: dict[str, Any] = {
-        "duration": 10.0,
-        "frequency": 0.2,
-        "amplitude": 2.0,
-        "offset": 8.0,
-        "duty_cycle": 50.0,
-        "waveform_type": "sine",
-        "y_axis_title": "Amplitude",
-        "y_min": 0.0,
-        "y_max": 10.0,
-        "theme": "dark",
-    }
+    global _config_cache
+    if _config_cache is None:
+        _config_cache = _read_config()
+    return dict(_config_cache)
+
+
+def _read_config() -> dict[str, Any]:
+    """Read and parse default.cfg, falling back to built-in defaults."""
+    defaults = dict(_DEFAULTS)
 
     config_path = _get_config_path()
     if not os.path.exists(config_path):
@@ -77,7 +93,7 @@ def load_config() -> dict[str, Any]:
 
 
 def save_config(settings: dict[str, Any]) -> bool:
-    """Write configuration to default.cfg.
+    """Write configuration to default.cfg and update the cached settings.
 
     Args:
         settings: Dict with keys: duration, frequency, amplitude, offset,
@@ -86,6 +102,7 @@ def save_config(settings: dict[str, Any]) -> bool:
     Returns:
         True if saved successfully, False otherwise.
     """
+    global _config_cache
     try:
         config_path = _get_config_path()
         lines = [
@@ -121,6 +138,8 @@ def save_config(settings: dict[str, Any]) -> bool:
         ]
         with open(config_path, "w", encoding="utf-8") as f:
             f.write("\n".join(lines))
+        # Keys missing from settings were written with their defaults
+        _config_cache = {**_DEFAULTS, **settings}
         return True
     except OSError:
         return False
@@ -128,25 +128,17 @@ def export_to_csv(
         else:
             return False, "No data to export"
 
-        # Build data rows
-        num_samples = len(time)
-        for i in range(num_samples):
-            row = [f"{time[i]:.6f}"]
-
-            # Add waveform amplitudes
-            for _, _, amp, _ in wfs:
-                row.append(f"{amp[i]:.6f}")
-
-            # Add envelope amplitudes
-            if envs:
-                for _, _, amp in envs:
-                    row.append(f"{amp[i]:.6f}")
-
-            lines.append(",".join(row))
+        # Stack all columns into one (samples x columns) array
+        columns = [time]
+        columns.extend(amp for _, _, amp, _ in wfs)
+        if envs:
+            columns.extend(amp for _, _, amp in envs)
+        data = np.column_stack(columns)
 
-        # Write to file
+        # Write header, then let NumPy format the data rows
         with open(filename, 'w', newline='', encoding='utf-8') as f:
-            f.write("\n".join(lines))
+            f.write("\n".join(lines) + "\n")
+            np.savetxt(f, data, fmt="%.6f", delimiter=",")
 
         return True, f"Successfully exported to {filename}"
 
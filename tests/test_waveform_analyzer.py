@@ -24,7 +24,8 @@ import pytest
 
 from waveform_generator import (
     gen_sine_wf, gen_square_wf, gen_sawtooth_wf, gen_triangle_wf,
-    gen_wf, compute_max_env, compute_min_env, compute_rms_env,
+    gen_wf, compute_max_env, compute_min_env, compute_rms_env, compute_envs,
+    compute_envs_stacked, lttb_downsample, band_downsample,
 )
 from app_state import (
     AppState, WfState,
@@ -36,9 +37,10 @@ from data_export import (
     export_to_csv, export_to_mat, export_to_json,
     prep_wf_for_export, sanitize_fname,
 )
+from scipy import signal
 from scipy.io import loadmat
 from config import load_config, save_config
-from ui_components import DARK_THEME, LIGHT_THEME
+from ui_components import DARK_THEME, LIGHT_THEME, _FLOAT_RE
 
 
 # ---------------------------------------------------------------------------
@@ -111,6 +113,19 @@ class TestWaveTypes:
         expected = np.array([offset - amp / 2, offset + amp / 2])
         np.testing.assert_allclose(unique_vals, expected, atol=1e-6)
 
+    def test_gen_wf_matches_type_generators(self) -> None:
+        """gen_wf dispatch matches the type-specific generators."""
+        expected = {
+            "sine": gen_sine_wf(1.5, 3.0, 2.0, 1.0),
+            "square": gen_square_wf(1.5, 3.0, 30.0, 2.0, 1.0),
+            "sawtooth": gen_sawtooth_wf(1.5, 3.0, 2.0, 1.0),
+            "triangle": gen_triangle_wf(1.5, 3.0, 2.0, 1.0),
+        }
+        for wf_type, (t_exp, y_exp) in expected.items():
+            t, y = gen_wf(wf_type.upper(), 1.5, 3.0, 2.0, 30.0, 1.0)
+            np.testing.assert_array_equal(t, t_exp)
+            np.testing.assert_array_equal(y, y_exp)
+
     def test_gen_wf_unrecognized_defaults_to_sine(self) -> None:
         """Unknown wf_type falls back to sine."""
         t1, y1 = gen_wf("sine", freq=1.0, amp=2.0, offset=0.0, dur=1.0)
@@ -118,6 +133,27 @@ class TestWaveTypes:
         np.testing.assert_array_equal(t1, t2)
         np.testing.assert_array_equal(y1, y2)
 
+    def test_kernels_match_scipy_signal(self) -> None:
+        """Square, sawtooth and triangle match their scipy.signal forms."""
+        t, _ = gen_wf("sine", freq=1.0, amp=1.0, dur=3.7)
+        phase = 2 * np.pi * 2.3 * t
+        expected = {
+            "square": signal.square(phase, duty=0.3),
+            "sawtooth": signal.sawtooth(phase),
+            "triangle": signal.sawtooth(phase, width=0.5),
+        }
+        for wf_type, unit in expected.items():
+            _, y = gen_wf(wf_type, 2.3, 3.0, 2.0, 30.0, 3.7)
+            np.testing.assert_allclose(y, 2.0 + 1.5 * unit, atol=1e-9)
+
+    def test_time_axis_shared_and_read_only(self) -> None:
+        """Waveforms with the same duration share one read-only time array."""
+        t1, y1 = gen_wf("sine", freq=1.0, amp=2.0, dur=2.0)
+        t2, _ = gen_wf("square", freq=3.0, amp=1.0, dur=2.0)
+        assert t1 is t2
+        assert not t1.flags.writeable
+        assert y1.flags.writeable
+
 
 # ---------------------------------------------------------------------------
 # Checklist Item: Edge cases — min/max frequency and amplitude
@@ -318,6 +354,79 @@ class TestEnvelopes:
         np.testing.assert_allclose(min_env, y, atol=1e-9)
         np.testing.assert_allclose(rms_env, np.abs(y), atol=1e-9)
 
+    def test_compute_envs_matches_individual(self) -> None:
+        """Fused pass matches the per-envelope functions; skipped ones are None."""
+        wfs = self._make_wfs(3, same_phase=False)
+        t, max_env, min_env, rms_env = compute_envs(wfs)
+        np.testing.assert_array_equal(t, wfs[0][0])
+        np.testing.assert_allclose(max_env, compute_max_env(wfs)[1])
+        np.testing.assert_allclose(min_env, compute_min_env(wfs)[1])
+        np.testing.assert_allclose(rms_env, compute_rms_env(wfs)[1])
+        _, max_only, no_min, no_rms = compute_envs(
+            wfs, want_min=False, want_rms=False
+        )
+        np.testing.assert_allclose(max_only, max_env)
+        assert no_min is None and no_rms is None
+
+    def test_compute_envs_stacked_matches_list(self) -> None:
+        """Stacked-matrix envelopes match the list-of-waveforms version."""
+        wfs = self._make_wfs(5, same_phase=False)
+        amps = np.stack([y for _, y in wfs])
+        expected = compute_envs(wfs)
+        result = compute_envs_stacked(wfs[0][0], amps)
+        assert result[0] is wfs[0][0]
+        for got, want in zip(result[1:], expected[1:]):
+            np.testing.assert_allclose(got, want)
+
+
+# ---------------------------------------------------------------------------
+# Display downsampling (LTTB)
+# ---------------------------------------------------------------------------
+
+class TestDownsampling:
+    """Verify LTTB and band display downsampling."""
+
+    def test_short_series_unchanged(self) -> None:
+        """Series at or below the target length are returned as-is."""
+        t, y = gen_sine_wf(1.0, 2.0, dur=1.0)
+        x_out, y_out = lttb_downsample(t, y, n_out=len(t))
+        assert x_out is t
+        assert y_out is y
+
+    def test_output_is_subset_with_endpoints(self) -> None:
+        """Output is bounded by n_out, keeps endpoints, and uses input points."""
+        t, y = gen_sine_wf(3.0, 2.0, dur=120.0)
+        x_out, y_out = lttb_downsample(t, y, n_out=2000)
+        assert 3 <= len(x_out) <= 2000
+        assert x_out[0] == t[0] and x_out[-1] == t[-1]
+        assert np.all(np.diff(x_out) > 0)
+        idx = np.searchsorted(t, x_out)
+        np.testing.assert_array_equal(y[idx], y_out)
+
+    def test_preserves_spike(self) -> None:
+        """A single-sample spike survives downsampling."""
+        t = np.linspace(0, 10, 100_000)
+        y = np.zeros_like(t)
+        y[54_321] = 5.0
+        _, y_out = lttb_downsample(t, y, n_out=500)
+        assert y_out.max() == 5.0
+
+    def test_band_keeps_extremes_and_span(self) -> None:
+        """Band decimation keeps the overall min/max and the full x range."""
+        t = np.linspace(0, 10, 100_000)
+        upper = np.sin(t * 37.0)
+        lower = upper - 1.0
+        upper[12_345] = 3.0
+        lower[67_890] = -4.0
+        x_out, lo_out, hi_out = band_downsample(t, lower, upper, n_out=800)
+        assert len(x_out) <= 800
+        assert x_out[0] == t[0] and x_out[-1] == t[-1]
+        assert hi_out.max() == 3.0
+        assert lo_out.min() == -4.0
+        assert np.all(hi_out >= lo_out)
+        _, no_lo, _ = band_downsample(t, None, upper, n_out=800)
+        assert no_lo is None
+
 
 # ---------------------------------------------------------------------------
 # Checklist Item: Mixed enabled/disabled waveforms
@@ -489,6 +598,27 @@ class TestCSVExport:
         finally:
             os.unlink(path)
 
+    def test_export_values_match(self) -> None:
+        """CSV data rows round-trip to the exported arrays."""
+        wf1 = _make_test_export_wf("Wave1")
+        wf2 = _make_test_export_wf("Wave2")
+        _, max_env = compute_max_env([(wf1[1], wf1[2]), (wf2[1], wf2[2])])
+        envs = [("Max_Envelope", wf1[1], max_env)]
+        with tempfile.NamedTemporaryFile(
+            suffix=".csv", delete=False, mode="w"
+        ) as f:
+            path = f.name
+        try:
+            ok, _ = export_to_csv(path, [wf1, wf2], envs=envs)
+            assert ok is True
+            data = np.loadtxt(path, delimiter=",", skiprows=6)
+            assert data.shape == (len(wf1[1]), 4)
+            np.testing.assert_allclose(data[:, 0], wf1[1], atol=1e-6)
+            np.testing.assert_allclose(data[:, 1], wf1[2], atol=1e-6)
+            np.testing.assert_allclose(data[:, 3], max_env, atol=1e-6)
+        finally:
+            os.unlink(path)
+
     def test_export_no_data(self) -> None:
         """Export with empty data returns failure."""
         with tempfile.NamedTemporaryFile(
@@ -622,6 +752,13 @@ class TestNoErrors:
         import data_export
         import config
 
+    def test_entry_number_pattern(self) -> None:
+        """Parameter entries accept finite numbers, including exponents."""
+        for text in ("5", "-2.5", "+.5", "3.", "1e2", "5E-1", "2.5e+3"):
+            assert _FLOAT_RE.match(text), text
+        for text in ("nan", "inf", "-inf", "1e", "e5", "1.2.3", "", "abc"):
+            assert not _FLOAT_RE.match(text), text
+
     def test_wf_state_clamps_parameters(self) -> None:
         """WfState clamps out-of-range values instead of raising errors."""
         wf = WfState(wf_id=0, freq=-10.0, amp=999.0, offset=-5.0,
@@ -722,6 +859,12 @@ class TestConfig:
         cfg = load_config()
         assert cfg["waveform_type"] in ("sine", "square", "sawtooth", "triangle")
 
+    def test_load_config_returns_copy(self) -> None:
+        """Mutating a loaded config does not leak into the cache."""
+        cfg = load_config()
+        cfg["y_axis_title"] = "Mutated"
+        assert load_config()["y_axis_title"] != "Mutated"
+
 
 # ---------------------------------------------------------------------------
 # MATLAB .mat export
@@ -968,6 +1111,15 @@ class TestColorCustomization:
         state.wfs[0].color = custom
         assert state.wfs[0].color == custom
 
+    def test_mpl_color_tracks_color(self) -> None:
+        """Cached matplotlib and hex colors follow the RGB color."""
+        state = AppState()
+        r, g, b = state.wfs[0].color
+        assert state.wfs[0].mpl_color == pytest.approx((r / 255, g / 255, b / 255))
+        state.wfs[0].color = (255, 0, 51)
+        assert state.wfs[0].mpl_color == pytest.approx((1.0, 0.0, 0.2))
+        assert state.wfs[0].hex_color == "#ff0033"
+
     def test_color_preserved_on_remove(self) -> None:
         """Custom color survives removal of another waveform."""
         state = AppState()
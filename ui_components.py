@@ -5,7 +5,12 @@ This module contains all CustomTkinter UI creation and callback logic.
 """
 
 import os
+import queue
+import re
 import sys
+import threading
+from functools import partial
+from time import monotonic
 from typing import Any, Optional, Tuple
 import numpy as np
 import tkinter as tk
@@ -17,9 +22,10 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.backends._backend_tk import NavigationToolbar2Tk
 from matplotlib.figure import Figure
+from matplotlib.patheffects import Normal, Stroke
 
 from app_state import (
-    app_state,
+    app_state, WfState,
     DEFAULT_DURATION, DEFAULT_FREQ, DEFAULT_AMP, DEFAULT_OFFSET, DEFAULT_DUTY_CYCLE,
     DURATION_MIN, DURATION_MAX, DURATION_STEP,
     FREQ_MIN, FREQ_MAX, FREQ_STEP,
@@ -28,9 +34,9 @@ from app_state import (
     DUTY_MIN, DUTY_MAX, DUTY_STEP
 )
 from config import load_config, save_config
-from waveform_generator import gen_wf, compute_max_env, compute_min_env, compute_rms_env
-from data_export import (
-    export_to_csv, export_to_mat, export_to_json, prep_wf_for_export
+from waveform_generator import (
+    gen_wf, compute_envs, compute_envs_stacked, lttb_downsample,
+    band_downsample
 )
 
 
@@ -137,9 +143,29 @@ SP_LG = 16   # section-to-section gap
 GLOW_LINEWIDTHS = [8, 6, 4]
 GLOW_ALPHAS = [0.1, 0.2, 0.3]
 GLOW_CORE_WIDTH = 2
+# Glow strokes drawn under the envelope line; they take the line's color
+_GLOW_EFFECTS = [
+    Stroke(linewidth=lw, alpha=alpha)
+    for lw, alpha in zip(GLOW_LINEWIDTHS, GLOW_ALPHAS)
+] + [Normal()]
+GLOW_RESUME_MS = 250  # Idle time after a parameter edit before glow returns
+PLOT_UPDATE_MS = 16  # Coalescing delay for replots (~one frame)
+PLOT_THROTTLE_MS = 66  # Min spacing of -/+ button replots (~15 Hz)
+EXPORT_POLL_MS = 100  # How often the Tk thread checks for an export result
+PLOT_POINTS_PER_PX = 4  # Display points per axes pixel (waveforms and envelopes)
+PLOT_MIN_POINTS = 1000  # Floor for the display point count on small axes
+PLOT_DTYPE = np.float32  # Line, envelope and cursor data precision; export stays float64
+
+# Finite number as typed into a parameter entry: decimal with an optional
+# exponent; rejects "nan"/"inf", which float() would accept
+_FLOAT_RE = re.compile(r'^[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?$')
+
+# Theme-independent context menu styling
+_MENU_STYLE = {"relief": "flat", "borderwidth": 0}
 
 # Cursor parameters
 CURSOR_PROXIMITY_THRESHOLD = 0.04  # 4% of visible Y range
+CURSOR_UPDATE_MS = 16  # Coalesce mouse motion to ~60 updates/s
 
 # Window dimensions
 WINDOW_DEFAULT_SIZE = "1200x1000"
@@ -153,7 +179,13 @@ PLOT_WINDOW_DEFAULT_SIZE = "800x600"
 class PlotWindow(ctk.CTkToplevel):
     """Separate window for detached plot display."""
 
-    def __init__(self, master: ctk.CTk, figure: Figure, on_close: Any):
+    def __init__(
+        self,
+        master: ctk.CTk,
+        figure: Figure,
+        on_close: Any,
+        icon_path: Optional[str] = None
+    ):
         """
         Initialize detached plot window.
 
@@ -161,14 +193,14 @@ class PlotWindow(ctk.CTkToplevel):
             master: Parent CTk window.
             figure: The matplotlib Figure to display.
             on_close: Callback function when window is closed.
+            icon_path: Path to an existing window icon, or None.
         """
         super().__init__(master)
         self.title("Waveform Analyzer - Detached Plot")
         self.geometry(PLOT_WINDOW_DEFAULT_SIZE)
 
         # Set window icon if available
-        icon_path = WaveformApp._get_icon_path()
-        if os.path.exists(icon_path):
+        if icon_path:
             self.after(200, lambda: self.iconbitmap(icon_path))
 
         self.on_close_callback = on_close
@@ -237,11 +269,77 @@ class WaveformApp(ctk.CTk):
         self.wf_buttons: list = []
         self.toggle_buttons: list = []
         self.remove_buttons: list = []
+        # Waveform list rows by wf id, reconfigured in place
+        self._wf_rows: dict[int, dict[str, Any]] = {}
+        self._last_wf_list_sig: Optional[tuple] = None
+        # (theme mode, style tables) from _wf_row_styles
+        self._wf_row_styles_cache: Optional[tuple] = None
+        # Right-click menu and hover tooltip, built on first use
         self._tooltip: Optional[Any] = None
-        self._section_labels: dict[ctk.CTkFrame, ctk.CTkLabel] = {}
-
-        # Cached waveform data for cursor proximity checks
-        self._cached_wf_data: list[Tuple[np.ndarray, np.ndarray]] = []
+        self._ctx_menu: Optional[Any] = None
+        self._ctx_menu_wf_id: int = 0
+        self._section_cards: list[ctk.CTkFrame] = []
+        self._section_headers: list[ctk.CTkLabel] = []
+        self._btn_state_cache: dict[ctk.CTkButton, str] = {}
+        # (success, message) from the export worker, polled on the Tk thread
+        self._export_results: queue.Queue = queue.Queue()
+        # Whether the duty cycle row is packed (None until first shown)
+        self._duty_visible: Optional[bool] = None
+        # Text variables bound to the parameter entries
+        self._entry_vars: dict[ctk.CTkEntry, ctk.StringVar] = {}
+
+        # Cached waveform data for cursor proximity checks: the shared
+        # time axis and one row of samples per enabled waveform
+        self._cached_wf_x: Optional[np.ndarray] = None
+        self._cached_wf_ys: Optional[np.ndarray] = None
+        # Start and step of the (uniform) cached time axis
+        self._cached_t0: float = 0.0
+        self._cached_dt: float = 0.0
+        # The amplitude arrays _cached_wf_ys was stacked from
+        self._cached_wf_srcs: list[np.ndarray] = []
+        # wf id -> (parameter key, time, amplitude, plot_x, plot_y,
+        # display points), so presentation-only replots skip generation
+        # and downsampling
+        self._wf_array_cache: dict[int, tuple] = {}
+        # (envelope flags, source amplitude arrays, compute_envs result)
+        self._env_cache: Optional[tuple] = None
+        # (compute_envs result, display points, downsampled envelopes)
+        self._env_display: Optional[tuple] = None
+        # Points per displayed line, from the axes width at the last rebuild
+        self._display_points: int = PLOT_MIN_POINTS
+
+        # Plot artist bookkeeping: data lines persist between updates and
+        # get new data via set_data(); a structural change forces a full
+        # ax.clear() and recreates them
+        self._wf_lines: dict[int, Any] = {}  # wf id -> Line2D
+        self._env_lines: dict[str, Any] = {}  # _theme key -> glowing Line2D
+        self._p2p_fill: Optional[Any] = None
+        self._legend: Optional[Any] = None
+        self._structural_dirty: bool = True
+        # _plot_sig() of the last drawn state; None forces the next update
+        self._last_plot_sig: Optional[tuple] = None
+        # True while a coalesced _update_all_plots call is scheduled
+        self._plot_update_pending: bool = False
+        self._plot_update_throttled: bool = False
+        self._plot_update_after_id: Optional[str] = None
+        # monotonic() time of the last scheduled replot, for throttling
+        self._last_plot_ts: float = 0.0
+        # Set while parameters are being adjusted; envelope glow is skipped
+        self._interactive_mode: bool = False
+        self._interactive_after_id: Optional[str] = None
+        # Flattened (id, wf_type, freq, amp, offset, duty_cycle, mpl_color,
+        # display_name) per enabled waveform, rebuilt on structural changes
+        self._enabled_snapshot: Optional[list[tuple]] = None
+        # The waveforms the snapshot (and _cached_wf_ys rows) were taken from
+        self._cached_enabled_wfs: list[WfState] = []
+
+        # Latest unprocessed mouse motion event; set while a flush is pending
+        self._motion_event: Optional[Any] = None
+        # Cursor snap distance in data units, kept in sync with the y-limits
+        self._cursor_y_threshold: float = 0.0
+        # Rendered plot without the live cursor, captured after each full
+        # draw so cursor motion can be blitted over it
+        self._plot_bg: Optional[Any] = None
 
         # Detached plot window state
         self.plot_window: Optional[PlotWindow] = None
@@ -263,8 +361,7 @@ class WaveformApp(ctk.CTk):
         self._create_status_bar()
 
         # Connect cursor events (always on)
-        self.canvas.mpl_connect('motion_notify_event', self._on_mouse_move)
-        self.canvas.mpl_connect('button_press_event', self._on_plot_click)
+        self._connect_canvas_events()
 
         # Initialize UI state
         self._update_wf_list()
@@ -283,10 +380,17 @@ class WaveformApp(ctk.CTk):
         return os.path.join(base_path, "icon.ico")
 
     def _set_icon(self):
-        """Set the window icon if available."""
+        """Set the window icon if available.
+
+        The resolved path (or None if missing) is kept in self._icon_path
+        for the dialogs and the detached plot window.
+        """
         icon_path = self._get_icon_path()
-        if os.path.exists(icon_path):
-            self.iconbitmap(icon_path)
+        self._icon_path: Optional[str] = (
+            icon_path if os.path.exists(icon_path) else None
+        )
+        if self._icon_path:
+            self.iconbitmap(self._icon_path)
 
     def _create_menu_bar(self):
         """Create the application menu bar using CTkMenuBar."""
@@ -354,10 +458,8 @@ class WaveformApp(ctk.CTk):
         _theme = LIGHT_THEME if _theme is DARK_THEME else DARK_THEME
         ctk.set_appearance_mode(_theme["ctk_mode"])
 
-        # Persist theme choice
-        cfg = load_config()
-        cfg["theme"] = _theme["ctk_mode"]
-        save_config(cfg)
+        # Persist theme choice (load_config is served from the cache)
+        save_config({**load_config(), "theme": _theme["ctk_mode"]})
 
         # Update matplotlib style and plot colors
         plt.style.use(_theme["plt_style"])
@@ -367,6 +469,7 @@ class WaveformApp(ctk.CTk):
         # Rebuild menu bar (CTkMenuBar colors are set in constructor)
         self.menu_bar.destroy()
         self._create_menu_bar()
+        self._discard_popups()
 
         # Re-pack content frame so menu bar stays on top
         self.content_frame.pack_forget()
@@ -374,18 +477,56 @@ class WaveformApp(ctk.CTk):
 
         # Update sidebar and card surface colors
         self.sidebar.configure(fg_color=_theme["surface"])
-        for card, label in self._section_labels.items():
-            card.configure(
-                fg_color=_theme["surface_container"],
-                border_color=_theme["separator"]
-            )
-            label.configure(text_color=_theme["section_header"])
+        surface_container = _theme["surface_container"]
+        separator = _theme["separator"]
+        section_header = _theme["section_header"]
+        for card in self._section_cards:
+            card.configure(fg_color=surface_container, border_color=separator)
+        for label in self._section_headers:
+            label.configure(text_color=section_header)
 
         # Refresh all UI
         self._update_wf_list()
         self._update_env_controls()
         self._update_add_button()
-        self._update_all_plots()
+
+        # Waveform data is unchanged, so recolor the plot in place
+        self._recolor_plot_artists()
+
+    def _recolor_plot_artists(self):
+        """Apply the current theme to the existing plot without replotting.
+
+        Axes decorations follow the matplotlib style's rcParams, envelope
+        lines take the color of the _theme key they are stored under, and
+        cursor readouts are rebuilt with the new colors. Waveform lines
+        keep their own colors.
+        """
+        ax = self.ax
+        rc = plt.rcParams
+        ax.tick_params(axis="x", colors=rc["xtick.color"])
+        ax.tick_params(axis="y", colors=rc["ytick.color"])
+        ax.xaxis.label.set_color(rc["axes.labelcolor"])
+        ax.yaxis.label.set_color(rc["axes.labelcolor"])
+        for spine in ax.spines.values():
+            spine.set_edgecolor(rc["axes.edgecolor"])
+        ax.grid(visible=True, alpha=0.3, color=_theme["separator"])
+
+        # The glow strokes inherit the line color
+        for theme_key, line in self._env_lines.items():
+            line.set_color(_theme[theme_key])
+        if self._p2p_fill is not None:
+            self._p2p_fill.set_color(_theme["p2p_fill"])
+
+        # Legend handles are copies, so rebuild it from the recolored lines
+        if self._legend is not None:
+            self._legend.remove()
+            self._build_legend()
+
+        if self._pinned_cursor_vline is not None:
+            self._pinned_cursor_vline.set_color(_theme["cursor_pinned"])
+        self._redraw_cursors(cleared=False)
+
+        self.canvas.draw_idle()
 
     def _toggle_plot_detachment(self):
         """Toggle between attached and detached plot modes."""
@@ -405,6 +546,13 @@ class WaveformApp(ctk.CTk):
     def _on_configure(self):
         """Open the Configure dialog."""
         current = load_config()
+        # Local bindings used throughout the dialog
+        theme = _theme
+        font_label = self._font_label
+        font_body = self._font_body
+        font_title = self._font_title
+        font_headline = self._font_headline
+        font_caption = self._font_caption
 
         dialog = ctk.CTkToplevel(self)
         dialog.title("Configure Defaults")
@@ -413,8 +561,8 @@ class WaveformApp(ctk.CTk):
         dialog.transient(self)
         dialog.grab_set()
 
-        icon_path = self._get_icon_path()
-        if os.path.exists(icon_path):
+        icon_path = self._icon_path
+        if icon_path:
             dialog.after(200, lambda: dialog.iconbitmap(icon_path))
 
         dialog.update_idletasks()
@@ -428,21 +576,21 @@ class WaveformApp(ctk.CTk):
 
         ctk.CTkLabel(
             content, text="Configure Defaults",
-            font=self._font_headline
+            font=font_headline
         ).pack(pady=(0, SP_XS))
         ctk.CTkLabel(
             content, text="Changes take effect on next launch.",
-            text_color=_theme["separator"],
-            font=self._font_caption
+            text_color=theme["separator"],
+            font=font_caption
         ).pack(pady=(0, SP_MD))
 
         def add_section(text: str):
-            sep = ctk.CTkFrame(content, height=1, fg_color=_theme["separator"])
+            sep = ctk.CTkFrame(content, height=1, fg_color=theme["separator"])
             sep.pack(fill="x", pady=(SP_SM, SP_XS))
             ctk.CTkLabel(
                 content, text=text,
-                text_color=_theme["section_header"],
-                font=self._font_title
+                text_color=theme["section_header"],
+                font=font_title
             ).pack(anchor="w")
 
         def add_row(label_text: str, default_val: Any) -> ctk.CTkEntry:
@@ -450,11 +598,11 @@ class WaveformApp(ctk.CTk):
             row.pack(fill="x", pady=SP_XS)
             ctk.CTkLabel(
                 row, text=label_text, width=160,
-                anchor="w", font=self._font_label
+                anchor="w", font=font_label
             ).pack(side="left")
             entry = ctk.CTkEntry(
                 row, width=180,
-                corner_radius=RADIUS_SMALL, font=self._font_body
+                corner_radius=RADIUS_SMALL, font=font_body
             )
             entry.insert(0, str(default_val))
             entry.pack(side="left")
@@ -471,7 +619,7 @@ class WaveformApp(ctk.CTk):
         type_row.pack(fill="x", pady=SP_XS)
         ctk.CTkLabel(
             type_row, text="Type:", width=160,
-            anchor="w", font=self._font_label
+            anchor="w", font=font_label
         ).pack(side="left")
         ctk.CTkOptionMenu(
             type_row, variable=type_var,
@@ -489,7 +637,7 @@ class WaveformApp(ctk.CTk):
         y_max_entry = add_row("Y-Axis Max:", current["y_max"])
 
         # Status label
-        status_lbl = ctk.CTkLabel(content, text="", font=self._font_caption)
+        status_lbl = ctk.CTkLabel(content, text="", font=font_caption)
         status_lbl.pack(pady=(SP_MD, 0))
 
         # Buttons
@@ -516,14 +664,14 @@ class WaveformApp(ctk.CTk):
             except ValueError:
                 status_lbl.configure(
                     text="Invalid value. Please check inputs.",
-                    text_color=_theme["error"]
+                    text_color=theme["error"]
                 )
                 return
             
             if new_y_min >= new_y_max:
                 status_lbl.configure(
                     text="Y-Axis Min must be less than Max.",
-                    text_color=_theme["error"]
+                    text_color=theme["error"]
                 )
                 return
             if save_config(new_settings):
@@ -531,30 +679,31 @@ class WaveformApp(ctk.CTk):
                 self._plot_y_min = new_y_min
                 self._plot_y_max = new_y_max
                 self._plot_y_title = new_settings["y_axis_title"]
-                self._update_all_plots()
+                self._structural_dirty = True
+                self._schedule_plot_update()
                 status_lbl.configure(
                     text="Saved. Waveform settings apply on next launch.",
-                    text_color=_theme["success"]
+                    text_color=theme["success"]
                 )
             else:
                 status_lbl.configure(
                     text="Failed to save configuration.",
-                    text_color=_theme["error"]
+                    text_color=theme["error"]
                 )
 
         ctk.CTkButton(
             btn_frame, text="Save", width=100,
             corner_radius=RADIUS_FULL,
-            fg_color=_theme["btn_primary"],
-            text_color=_theme["btn_primary_text"],
-            font=self._font_body, command=on_save
+            fg_color=theme["btn_primary"],
+            text_color=theme["btn_primary_text"],
+            font=font_body, command=on_save
         ).pack(side="left", padx=(0, SP_SM))
         ctk.CTkButton(
             btn_frame, text="Cancel", width=100,
             corner_radius=RADIUS_FULL,
-            fg_color=_theme["btn_tonal"],
-            text_color=_theme["btn_tonal_text"],
-            font=self._font_body, command=dialog.destroy
+            fg_color=theme["btn_tonal"],
+            text_color=theme["btn_tonal_text"],
+            font=font_body, command=dialog.destroy
         ).pack(side="left")
 
     def _show_about_dialog(self):
@@ -567,8 +716,8 @@ class WaveformApp(ctk.CTk):
         dialog.grab_set()
 
         # Set dialog icon
-        icon_path = self._get_icon_path()
-        if os.path.exists(icon_path):
+        icon_path = self._icon_path
+        if icon_path:
             dialog.after(200, lambda: dialog.iconbitmap(icon_path))
 
         # Center the dialog on the main window
@@ -682,7 +831,8 @@ class WaveformApp(ctk.CTk):
             self._create_param_row(
                 "Wave Duration (s)", DEFAULT_DURATION,
                 self._on_duration_enter,
-                self._on_duration_dec, self._on_duration_inc,
+                partial(self._bump_param, "duration", DURATION_MIN, DURATION_MAX, -DURATION_STEP),
+                partial(self._bump_param, "duration", DURATION_MIN, DURATION_MAX, DURATION_STEP),
                 parent=self._params_card
             )
 
@@ -692,7 +842,8 @@ class WaveformApp(ctk.CTk):
             self._create_param_row(
                 "Offset", DEFAULT_OFFSET,
                 self._on_offset_enter,
-                self._on_offset_dec, self._on_offset_inc,
+                partial(self._bump_param, "offset", OFFSET_MIN, OFFSET_MAX, -OFFSET_STEP),
+                partial(self._bump_param, "offset", OFFSET_MIN, OFFSET_MAX, OFFSET_STEP),
                 parent=self._params_card
             )
 
@@ -702,7 +853,8 @@ class WaveformApp(ctk.CTk):
             self._create_param_row(
                 "Frequency (Hz)", DEFAULT_FREQ,
                 self._on_freq_enter,
-                self._on_freq_dec, self._on_freq_inc,
+                partial(self._bump_param, "freq", FREQ_MIN, FREQ_MAX, -FREQ_STEP),
+                partial(self._bump_param, "freq", FREQ_MIN, FREQ_MAX, FREQ_STEP),
                 parent=self._params_card
             )
 
@@ -712,7 +864,8 @@ class WaveformApp(ctk.CTk):
             self._create_param_row(
                 "Amplitude", DEFAULT_AMP,
                 self._on_amp_enter,
-                self._on_amp_dec, self._on_amp_inc,
+                partial(self._bump_param, "amp", AMP_MIN, AMP_MAX, -AMP_STEP),
+                partial(self._bump_param, "amp", AMP_MIN, AMP_MAX, AMP_STEP),
                 parent=self._params_card
             )
 
@@ -722,11 +875,25 @@ class WaveformApp(ctk.CTk):
             self._create_param_row(
                 "Duty Cycle (%)", DEFAULT_DUTY_CYCLE,
                 self._on_duty_enter,
-                self._on_duty_dec, self._on_duty_inc,
+                partial(self._bump_param, "duty_cycle", DUTY_MIN, DUTY_MAX, -DUTY_STEP),
+                partial(self._bump_param, "duty_cycle", DUTY_MIN, DUTY_MAX, DUTY_STEP),
                 parent=self._params_card,
                 pack=False
             )
 
+        # Row widgets by parameter name, for the shared -/+ handler
+        self._param_widgets: dict[
+            str, Tuple[ctk.CTkEntry, ctk.CTkButton, ctk.CTkButton]
+        ] = {
+            "duration": (
+                self.duration_entry, self.duration_dec_btn, self.duration_inc_btn
+            ),
+            "offset": (self.offset_entry, self.offset_dec_btn, self.offset_inc_btn),
+            "freq": (self.freq_entry, self.freq_dec_btn, self.freq_inc_btn),
+            "amp": (self.amp_entry, self.amp_dec_btn, self.amp_inc_btn),
+            "duty_cycle": (self.duty_entry, self.duty_dec_btn, self.duty_inc_btn),
+        }
+
         # === Advanced Card ===
         adv_card = self._create_section_card("Advanced")
 
@@ -789,6 +956,9 @@ class WaveformApp(ctk.CTk):
 
         # Live cursor state: tracks mouse, click pins a reference
         self._live_cursor_x: Optional[float] = None
+        self._live_cursor_y: Optional[float] = None
+        # (sample index, y in hundredths) the live readout was built for
+        self._live_cursor_key: Optional[tuple] = None
         self._live_cursor_vline: Optional[Any] = None
         self._pinned_cursor_x: Optional[float] = None
         self._pinned_cursor_vline: Optional[Any] = None
@@ -800,14 +970,20 @@ class WaveformApp(ctk.CTk):
         # === Export Card ===
         export_card = self._create_section_card("Export")
 
-        ctk.CTkButton(
+        self.export_btn = ctk.CTkButton(
             export_card, text="Export Waveform Data",
             command=self._on_export_clicked,
             corner_radius=RADIUS_FULL,
             fg_color=_theme["btn_primary"],
             text_color=_theme["btn_primary_text"],
             font=self._font_body
-        ).pack(fill="x", padx=SP_MD, pady=(0, SP_SM))
+        )
+        self.export_btn.pack(fill="x", padx=SP_MD, pady=(0, SP_SM))
+
+        # Shown (above the status) only while an export is running
+        self.export_progress = ctk.CTkProgressBar(
+            export_card, mode="indeterminate", height=4
+        )
 
         self.export_status = ctk.CTkLabel(
             export_card, text="Status: Ready",
@@ -931,7 +1107,8 @@ class WaveformApp(ctk.CTk):
         self.plot_window = PlotWindow(
             master=self,
             figure=self.fig,
-            on_close=self._attach_plot
+            on_close=self._attach_plot,
+            icon_path=self._icon_path
         )
 
         # Update canvas and toolbar references to detached window
@@ -939,11 +1116,10 @@ class WaveformApp(ctk.CTk):
         self.toolbar = self.plot_window.toolbar
 
         # Reconnect matplotlib events
-        self.canvas.mpl_connect('motion_notify_event', self._on_mouse_move)
-        self.canvas.mpl_connect('button_press_event', self._on_plot_click)
+        self._connect_canvas_events()
 
         # Redraw in detached window
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
     def _attach_plot(self):
         """Return plot from detached window to main window."""
@@ -965,11 +1141,10 @@ class WaveformApp(ctk.CTk):
         self.canvas, self.toolbar = self._create_embedded_plot_widgets(self.plot_frame)
 
         # Reconnect matplotlib events
-        self.canvas.mpl_connect('motion_notify_event', self._on_mouse_move)
-        self.canvas.mpl_connect('button_press_event', self._on_plot_click)
+        self._connect_canvas_events()
 
         # Redraw in main window
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
     def _create_section_card(self, title: str) -> ctk.CTkFrame:
         """Create a WinUI-style card with a title header.
@@ -995,7 +1170,8 @@ class WaveformApp(ctk.CTk):
             font=self._font_title
         )
         label.pack(anchor="w", padx=SP_MD, pady=(SP_MD, SP_SM))
-        self._section_labels[card] = label
+        self._section_cards.append(card)
+        self._section_headers.append(label)
 
         return card
 
@@ -1029,12 +1205,13 @@ class WaveformApp(ctk.CTk):
         )
         frame = ctk.CTkFrame(container, fg_color="transparent")
 
+        var = ctk.StringVar(value=f"{default_val:.1f}")
         entry = ctk.CTkEntry(
-            frame, width=120,
+            frame, width=120, textvariable=var,
             corner_radius=RADIUS_SMALL, font=self._font_body
         )
         entry.pack(side="left", padx=(0, SP_XS))
-        entry.insert(0, f"{default_val:.1f}")
+        self._entry_vars[entry] = var
         entry.bind("<Return>", on_enter)
         entry.bind("<FocusOut>", on_enter)
 
@@ -1064,14 +1241,28 @@ class WaveformApp(ctk.CTk):
 
         return label, frame, entry, dec_btn, inc_btn
 
+    def _set_entry_value(self, entry: ctk.CTkEntry, value: float):
+        """Show a value in a parameter entry, skipping no-op rewrites.
+
+        Sets the entry's bound text variable, a single update rather than
+        a delete followed by an insert.
+
+        Args:
+            entry: The parameter entry to update.
+            value: Value to display (formatted to one decimal place).
+        """
+        text = f"{value:.1f}"
+        var = self._entry_vars[entry]
+        if var.get() != text:
+            var.set(text)
+
     # === Callback Methods ===
 
-    def _is_duplicate_name(self, name: str, exclude_id: int) -> bool:
-        """Check if a waveform name is already in use."""
-        for wf in app_state.wfs:
-            if wf.id != exclude_id and wf.display_name == name:
-                return True
-        return False
+    def _taken_names(self, exclude_id: int) -> frozenset[str]:
+        """Return the display names of all waveforms except exclude_id."""
+        return frozenset(
+            wf.display_name for wf in app_state.wfs if wf.id != exclude_id
+        )
 
     def _on_rename_wf(self, wf_id: int):
         """Show rename dialog for a waveform."""
@@ -1079,6 +1270,8 @@ class WaveformApp(ctk.CTk):
         if not wf:
             return
 
+        # Names can't change while the modal dialog is up
+        taken = self._taken_names(wf_id)
         prompt = f"Enter new name for {wf.display_name}:"
         while True:
             dialog = ctk.CTkInputDialog(
@@ -1094,10 +1287,11 @@ class WaveformApp(ctk.CTk):
 
             # Empty name reverts to default - check that default isn't taken
             check_name = new_name if new_name else f"Waveform {wf.id + 1}"
-            if not self._is_duplicate_name(check_name, wf_id):
+            if check_name not in taken:
                 wf.name = new_name
                 self._update_wf_list()
-                self._update_all_plots()
+                self._structural_dirty = True
+                self._schedule_plot_update()
                 return
 
             prompt = f'"{check_name}" is already in use.\nEnter a different name:'
@@ -1108,9 +1302,8 @@ class WaveformApp(ctk.CTk):
         if not wf:
             return
 
-        initial_hex = '#{:02x}{:02x}{:02x}'.format(*wf.color)
         result = askcolor(
-            color=initial_hex,
+            color=wf.hex_color,
             title=f"Choose Color for {wf.display_name}"
         )
 
@@ -1119,85 +1312,152 @@ class WaveformApp(ctk.CTk):
 
         rgb = result[0]
         wf.color = (int(rgb[0]), int(rgb[1]), int(rgb[2]))
-        self._update_wf_list()
-        self._update_all_plots()
+        self._sync_enabled_snapshot(wf)
+
+        # Recolor the existing line instead of rebuilding the axes; the
+        # legend holds copies of the handles, so rebuild just the legend
+        line = self._wf_lines.get(wf.id)
+        if line is not None:
+            line.set_color(wf.mpl_color)
+            if self._legend is not None:
+                self._legend.remove()
+                self._build_legend()
+        self._schedule_plot_update()
 
     def _show_wf_context_menu(self, event: tk.Event, wf_id: int):
-        """Show right-click context menu for a waveform button."""
-        menu_style = {
-            "bg": _theme["bg"],
-            "fg": _theme["text"],
-            "activebackground": _theme["selected_bg"],
-            "activeforeground": _theme["text"],
-            "relief": "flat",
-            "borderwidth": 0,
-        }
-        ctx_menu = Menu(self, tearoff=0, **menu_style) # type: ignore
-        ctx_menu.add_command(
-            label="Rename...",
-            command=lambda: self._on_rename_wf(wf_id)
-        )
-        ctx_menu.add_command(
-            label="Change Color...",
-            command=lambda: self._on_color_wf(wf_id)
-        )
-        ctx_menu.bind("<Unmap>", lambda _: ctx_menu.destroy())
-        ctx_menu.tk_popup(event.x_root, event.y_root)
+        """Show right-click context menu for a waveform button.
+
+        The menu is built on first use and reused; its commands act on
+        the waveform it was last opened for.
+        """
+        self._ctx_menu_wf_id = wf_id
+        if self._ctx_menu is None:
+            ctx_menu = Menu(
+                self, tearoff=0,
+                bg=_theme["bg"],
+                fg=_theme["text"],
+                activebackground=_theme["selected_bg"],
+                activeforeground=_theme["text"],
+                **_MENU_STYLE
+            ) # type: ignore
+            ctx_menu.add_command(
+                label="Rename...",
+                command=lambda: self._on_rename_wf(self._ctx_menu_wf_id)
+            )
+            ctx_menu.add_command(
+                label="Change Color...",
+                command=lambda: self._on_color_wf(self._ctx_menu_wf_id)
+            )
+            self._ctx_menu = ctx_menu
+        self._ctx_menu.tk_popup(event.x_root, event.y_root)
 
     def _show_tooltip(self, event: tk.Event):
-        """Show tooltip near the cursor."""
-        self._hide_tooltip()
-        tip = Toplevel(self)
-        tip.wm_overrideredirect(True)
+        """Show tooltip near the cursor.
+
+        The tooltip window is built on first use and then only moved,
+        shown and withdrawn.
+        """
+        tip = self._tooltip
+        if tip is None:
+            tip = Toplevel(self)
+            tip.wm_overrideredirect(True)
+            Label(
+                tip, text="Right-click to rename or change color",
+                background=_theme["surface_container"],
+                foreground=_theme["text"],
+                relief="solid", borderwidth=1,
+                padx=SP_SM, pady=SP_XS,
+                font=(_FONT_FAMILY, 9)
+            ).pack()
+            self._tooltip = tip
         tip.wm_geometry(f"+{event.x_root + 10}+{event.y_root + 10}")
-        lbl = Label(
-            tip, text="Right-click to rename or change color",
-            background=_theme["surface_container"],
-            foreground=_theme["text"],
-            relief="solid", borderwidth=1,
-            padx=SP_SM, pady=SP_XS,
-            font=(_FONT_FAMILY, 9)
-        )
-        lbl.pack()
-        self._tooltip = tip
+        tip.deiconify()
 
     def _hide_tooltip(self, event: Optional[tk.Event] = None):
-        """Destroy the tooltip if it exists."""
-        if self._tooltip:
+        """Hide the tooltip if it exists."""
+        if self._tooltip is not None:
+            self._tooltip.withdraw()
+
+    def _discard_popups(self):
+        """Destroy the cached context menu and tooltip.
+
+        Called on theme changes so they are rebuilt with the new colors.
+        """
+        if self._ctx_menu is not None:
+            self._ctx_menu.destroy()
+            self._ctx_menu = None
+        if self._tooltip is not None:
             self._tooltip.destroy()
             self._tooltip = None
 
     def _on_duration_enter(self, event: Optional[tk.Event] = None):
         """Handle duration entry."""
-        try:
-            value = float(self.duration_entry.get())
-            value = max(DURATION_MIN, min(DURATION_MAX, value))
+        self._apply_clamped("duration", DURATION_MIN, DURATION_MAX)
+
+    def _apply_clamped(self, attr: str, lo: float, hi: float):
+        """Apply a typed parameter value from its entry.
+
+        The text is matched against _FLOAT_RE instead of relying on
+        float() raising; anything else restores the current value.
+
+        Args:
+            attr: "duration" for the wave duration, otherwise the name of
+                the active waveform's attribute.
+            lo: Lower bound.
+            hi: Upper bound.
+        """
+        target = app_state if attr == "duration" else app_state.get_active_wf()
+        if not target:
+            return
+        entry, dec_btn, inc_btn = self._param_widgets[attr]
+        current = getattr(target, attr)
+        text = entry.get().strip()
+        if text == f"{current:.1f}":
+            return  # Unedited
+        if not _FLOAT_RE.match(text):
+            self._set_entry_value(entry, current)
+            return
+        value = self._adjust_param(float(text), lo, hi, dec_btn, inc_btn)
+        self._set_entry_value(entry, value)
+        if value == current:
+            return
+        if target is app_state:
             app_state.set_duration(value)
-            self.duration_entry.delete(0, "end")
-            self.duration_entry.insert(0, f"{value:.1f}")
-            self._update_duration_btns()
-            self._update_all_plots()
-        except ValueError:
-            self.duration_entry.delete(0, "end")
-            self.duration_entry.insert(0, f"{app_state.duration:.1f}")
-
-    def _on_duration_inc(self):
-        """Increment duration."""
-        new_value = min(DURATION_MAX, app_state.duration + DURATION_STEP)
-        app_state.set_duration(new_value)
-        self.duration_entry.delete(0, "end")
-        self.duration_entry.insert(0, f"{new_value:.1f}")
-        self._update_duration_btns()
-        self._update_all_plots()
+        else:
+            setattr(target, attr, value)
+            self._sync_enabled_snapshot(target)
+        self._enter_interactive()
+        self._schedule_plot_update()
 
-    def _on_duration_dec(self):
-        """Decrement duration."""
-        new_value = max(DURATION_MIN, app_state.duration - DURATION_STEP)
-        app_state.set_duration(new_value)
-        self.duration_entry.delete(0, "end")
-        self.duration_entry.insert(0, f"{new_value:.1f}")
-        self._update_duration_btns()
-        self._update_all_plots()
+    def _bump_param(self, attr: str, lo: float, hi: float, step: float):
+        """Step a parameter from its -/+ button.
+
+        Bound per button with functools.partial, so each row's bounds and
+        step are fixed at creation.
+
+        Args:
+            attr: "duration" for the wave duration, otherwise the name of
+                the active waveform's attribute.
+            lo: Lower bound.
+            hi: Upper bound.
+            step: Signed step to add to the current value.
+        """
+        target = app_state if attr == "duration" else app_state.get_active_wf()
+        if not target:
+            return
+        entry, dec_btn, inc_btn = self._param_widgets[attr]
+        current = getattr(target, attr)
+        new_value = self._adjust_param(current + step, lo, hi, dec_btn, inc_btn)
+        if new_value == current:
+            return
+        if target is app_state:
+            app_state.set_duration(new_value)
+        else:
+            setattr(target, attr, new_value)
+            self._sync_enabled_snapshot(target)
+        self._set_entry_value(entry, new_value)
+        self._enter_interactive()
+        self._schedule_plot_update(throttle=True)
 
     def _on_env_changed(self, attr: str, var: ctk.BooleanVar):
         """Handle any envelope toggle.
@@ -1209,7 +1469,8 @@ class WaveformApp(ctk.CTk):
         setattr(app_state, attr, var.get())
         self._auto_hide_source_waveforms()
         self._update_env_controls()
-        self._update_all_plots()
+        self._structural_dirty = True
+        self._schedule_plot_update()
 
     def _auto_hide_source_waveforms(self):
         """Automatically hide/show source waveforms based on envelope state."""
@@ -1228,7 +1489,8 @@ class WaveformApp(ctk.CTk):
             self._update_wf_list()
             self._update_wf_parameters()
             self._update_env_controls()
-            self._update_all_plots()
+            self._structural_dirty = True
+            self._schedule_plot_update()
             self._update_add_button()
 
     def _on_remove_wf(self, wf_id: int):
@@ -1237,7 +1499,8 @@ class WaveformApp(ctk.CTk):
             self._update_wf_list()
             self._update_wf_parameters()
             self._update_env_controls()
-            self._update_all_plots()
+            self._structural_dirty = True
+            self._schedule_plot_update()
             self._update_add_button()
 
     def _on_toggle_wf(self, wf_id: int):
@@ -1245,175 +1508,47 @@ class WaveformApp(ctk.CTk):
         wf = app_state.get_wf(wf_id)
         if wf:
             wf.enabled = not wf.enabled
+            hide_src = app_state.hide_src_wfs
             self._update_env_controls()
-            self._update_all_plots()
-            self._update_wf_list()
+            self._structural_dirty = True
+            self._schedule_plot_update()
+            if app_state.hide_src_wfs != hide_src:
+                # Envelopes were switched off; remove/add are allowed again
+                self._update_wf_management_controls()
+            else:
+                self._update_wf_rows(wf_id)
 
     def _on_select_wf(self, wf_id: int):
         """Select a waveform for editing."""
+        previous = app_state.active_wf_index
         app_state.active_wf_index = wf_id
         self._update_wf_parameters()
-        self._update_wf_list()
+        self._update_wf_rows(previous, wf_id)
 
     def _on_wf_type_changed(self, value: str):
         """Handle waveform type change."""
         wf = app_state.get_active_wf()
         if wf:
             wf.wf_type = value.lower()
+            self._sync_enabled_snapshot(wf)
             self._update_wf_parameters()
-            self._update_all_plots()
+            self._schedule_plot_update()
 
     def _on_freq_enter(self, event: Optional[tk.Event] = None):
         """Handle frequency entry."""
-        wf = app_state.get_active_wf()
-        if wf:
-            try:
-                value = float(self.freq_entry.get())
-                value = max(FREQ_MIN, min(FREQ_MAX, value))
-                wf.freq = value
-                self.freq_entry.delete(0, "end")
-                self.freq_entry.insert(0, f"{value:.1f}")
-                self._update_freq_btns()
-                self._update_all_plots()
-            except ValueError:
-                self.freq_entry.delete(0, "end")
-                self.freq_entry.insert(0, f"{wf.freq:.1f}")
-
-    def _on_freq_inc(self):
-        """Increment frequency."""
-        wf = app_state.get_active_wf()
-        if wf:
-            new_value = min(FREQ_MAX, wf.freq + FREQ_STEP)
-            wf.freq = new_value
-            self.freq_entry.delete(0, "end")
-            self.freq_entry.insert(0, f"{new_value:.1f}")
-            self._update_freq_btns()
-            self._update_all_plots()
-
-    def _on_freq_dec(self):
-        """Decrement frequency."""
-        wf = app_state.get_active_wf()
-        if wf:
-            new_value = max(FREQ_MIN, wf.freq - FREQ_STEP)
-            wf.freq = new_value
-            self.freq_entry.delete(0, "end")
-            self.freq_entry.insert(0, f"{new_value:.1f}")
-            self._update_freq_btns()
-            self._update_all_plots()
+        self._apply_clamped("freq", FREQ_MIN, FREQ_MAX)
 
     def _on_amp_enter(self, event: Optional[tk.Event] = None):
         """Handle amplitude entry."""
-        wf = app_state.get_active_wf()
-        if wf:
-            try:
-                value = float(self.amp_entry.get())
-                value = max(AMP_MIN, min(AMP_MAX, value))
-                wf.amp = value
-                self.amp_entry.delete(0, "end")
-                self.amp_entry.insert(0, f"{value:.1f}")
-                self._update_amp_btns()
-                self._update_all_plots()
-            except ValueError:
-                self.amp_entry.delete(0, "end")
-                self.amp_entry.insert(0, f"{wf.amp:.1f}")
-
-    def _on_amp_inc(self):
-        """Increment amplitude."""
-        wf = app_state.get_active_wf()
-        if wf:
-            new_value = min(AMP_MAX, wf.amp + AMP_STEP)
-            wf.amp = new_value
-            self.amp_entry.delete(0, "end")
-            self.amp_entry.insert(0, f"{new_value:.1f}")
-            self._update_amp_btns()
-            self._update_all_plots()
-
-    def _on_amp_dec(self):
-        """Decrement amplitude."""
-        wf = app_state.get_active_wf()
-        if wf:
-            new_value = max(AMP_MIN, wf.amp - AMP_STEP)
-            wf.amp = new_value
-            self.amp_entry.delete(0, "end")
-            self.amp_entry.insert(0, f"{new_value:.1f}")
-            self._update_amp_btns()
-            self._update_all_plots()
+        self._apply_clamped("amp", AMP_MIN, AMP_MAX)
 
     def _on_offset_enter(self, event: Optional[tk.Event] = None):
         """Handle offset entry."""
-        wf = app_state.get_active_wf()
-        if wf:
-            try:
-                value = float(self.offset_entry.get())
-                value = max(OFFSET_MIN, min(OFFSET_MAX, value))
-                wf.offset = value
-                self.offset_entry.delete(0, "end")
-                self.offset_entry.insert(0, f"{value:.1f}")
-                self._update_offset_btns()
-                self._update_all_plots()
-            except ValueError:
-                self.offset_entry.delete(0, "end")
-                self.offset_entry.insert(0, f"{wf.offset:.1f}")
-
-    def _on_offset_inc(self):
-        """Increment offset."""
-        wf = app_state.get_active_wf()
-        if wf:
-            new_value = min(OFFSET_MAX, wf.offset + OFFSET_STEP)
-            wf.offset = new_value
-            self.offset_entry.delete(0, "end")
-            self.offset_entry.insert(0, f"{new_value:.1f}")
-            self._update_offset_btns()
-            self._update_all_plots()
-
-    def _on_offset_dec(self):
-        """Decrement offset."""
-        wf = app_state.get_active_wf()
-        if wf:
-            new_value = max(OFFSET_MIN, wf.offset - OFFSET_STEP)
-            wf.offset = new_value
-            self.offset_entry.delete(0, "end")
-            self.offset_entry.insert(0, f"{new_value:.1f}")
-            self._update_offset_btns()
-            self._update_all_plots()
+        self._apply_clamped("offset", OFFSET_MIN, OFFSET_MAX)
 
     def _on_duty_enter(self, event: Optional[tk.Event] = None):
         """Handle duty cycle entry."""
-        wf = app_state.get_active_wf()
-        if wf:
-            try:
-                value = float(self.duty_entry.get())
-                value = max(DUTY_MIN, min(DUTY_MAX, value))
-                wf.duty_cycle = value
-                self.duty_entry.delete(0, "end")
-                self.duty_entry.insert(0, f"{value:.1f}")
-                self._update_duty_btns()
-                self._update_all_plots()
-            except ValueError:
-                self.duty_entry.delete(0, "end")
-                self.duty_entry.insert(0, f"{wf.duty_cycle:.1f}")
-
-    def _on_duty_inc(self):
-        """Increment duty cycle."""
-        wf = app_state.get_active_wf()
-        if wf:
-            new_value = min(DUTY_MAX, wf.duty_cycle + DUTY_STEP)
-            wf.duty_cycle = new_value
-            self.duty_entry.delete(0, "end")
-            self.duty_entry.insert(0, f"{new_value:.1f}")
-            self._update_duty_btns()
-            self._update_all_plots()
-
-    def _on_duty_dec(self):
-        """Decrement duty cycle."""
-        wf = app_state.get_active_wf()
-        if wf:
-            new_value = max(DUTY_MIN, wf.duty_cycle - DUTY_STEP)
-            wf.duty_cycle = new_value
-            self.duty_entry.delete(0, "end")
-            self.duty_entry.insert(0, f"{new_value:.1f}")
-            self._update_duty_btns()
-            self._update_all_plots()
+        self._apply_clamped("duty_cycle", DUTY_MIN, DUTY_MAX)
 
     def _on_export_clicked(self):
         """Handle export button click - shows native file dialog."""
@@ -1431,48 +1566,8 @@ class WaveformApp(ctk.CTk):
         if not filename:
             return  # User cancelled
 
-        # Collect enabled waveform data
-        wfs_to_export = []
-        wf_arrays = []
-        for wf in app_state.get_enabled_wfs():
-            time, amp = gen_wf(
-                wf.wf_type,
-                wf.freq,
-                wf.amp,
-                wf.offset,
-                wf.duty_cycle,
-                app_state.duration,
-                app_state.sample_rate
-            )
-            wf_arrays.append((time, amp))
-
-            name = wf.display_name.replace(" ", "_")
-            export_data = prep_wf_for_export(
-                name, time, amp,
-                wf.wf_type,
-                wf.freq,
-                wf.amp,
-                wf.offset,
-                wf.duty_cycle
-            )
-            wfs_to_export.append(export_data)
-
-        # Collect envelope data if enabled
-        envs_to_export = []
-        if app_state.can_show_envelopes() and wf_arrays:
-            if app_state.show_max_env:
-                time, max_env = compute_max_env(wf_arrays)
-                envs_to_export.append(("Max_Envelope", time, max_env))
-
-            if app_state.show_min_env:
-                time, min_env = compute_min_env(wf_arrays)
-                envs_to_export.append(("Min_Envelope", time, min_env))
-
-            if app_state.show_rms_env:
-                time, rms_env = compute_rms_env(wf_arrays)
-                envs_to_export.append(("RMS_Envelope", time, rms_env))
-
-        envs_arg = envs_to_export if envs_to_export else None
+        # Imported on first export; keeps scipy.io off the startup path
+        from data_export import export_to_csv, export_to_mat, export_to_json
 
         # Select export function based on file extension
         ext = os.path.splitext(filename)[1].lower()
@@ -1483,15 +1578,132 @@ class WaveformApp(ctk.CTk):
         else:
             export_fn = export_to_csv
 
-        success, message = export_fn(
-            filename,
-            wfs_to_export,
-            envs_arg,
-            app_state.sample_rate,
-            app_state.duration
+        # Snapshot the state here; the worker thread must not read it.
+        # Arrays still current in the plot caches are handed over as-is
+        dur = app_state.duration
+        sample_rate = app_state.sample_rate
+        wf_params = []
+        for wf in app_state.get_enabled_wfs():
+            key = (wf.wf_type, wf.freq, wf.amp, wf.offset, wf.duty_cycle,
+                   dur, sample_rate)
+            cached = self._wf_array_cache.get(wf.id)
+            arrays = cached[1:3] if cached and cached[0] == key else None
+            wf_params.append((
+                wf.display_name.replace(" ", "_"), wf.wf_type, wf.freq,
+                wf.amp, wf.offset, wf.duty_cycle, arrays
+            ))
+        if app_state.can_show_envelopes():
+            env_flags = (
+                app_state.show_max_env,
+                app_state.show_min_env,
+                app_state.show_rms_env
+            )
+        else:
+            env_flags = (False, False, False)
+
+        self.export_btn.configure(state="disabled")
+        self.export_status.configure(
+            text="Status: Exporting...", text_color=_theme["text"]
+        )
+        self.export_progress.pack(
+            fill="x", padx=SP_MD, pady=(0, SP_SM), before=self.export_status
         )
+        self.export_progress.start()
 
-        # Update status
+        threading.Thread(
+            target=self._do_export,
+            args=(
+                filename, export_fn, wf_params, env_flags,
+                dur, sample_rate
+            ),
+            daemon=True
+        ).start()
+        self.after(EXPORT_POLL_MS, self._poll_export)
+
+    def _do_export(
+        self,
+        filename: str,
+        export_fn: Any,
+        wf_params: list[tuple],
+        env_flags: Tuple[bool, bool, bool],
+        dur: float,
+        sample_rate: int
+    ):
+        """Generate and write the export data on a worker thread.
+
+        Makes no Tk calls at all, so closing the window mid-export can't
+        raise here; the result is queued for _poll_export.
+
+        Args:
+            filename: Destination filename.
+            export_fn: export_to_csv, export_to_mat or export_to_json.
+            wf_params: (name, wf_type, freq, amp, offset, duty_cycle,
+                arrays) per enabled waveform; arrays is a cached
+                (time, amplitude) pair or None to generate it.
+            env_flags: (max, min, rms) envelopes to include. They are
+                computed here from the float64 arrays, not taken from the
+                float32 plot matrix.
+            dur: Duration in seconds.
+            sample_rate: Sample rate in samples/second.
+        """
+        from data_export import prep_wf_for_export
+
+        try:
+            # Collect enabled waveform data
+            wfs_to_export = []
+            wf_arrays = []
+            for (name, wf_type, freq, amp, offset, duty_cycle,
+                 arrays) in wf_params:
+                if arrays is None:
+                    arrays = gen_wf(
+                        wf_type, freq, amp, offset, duty_cycle, dur,
+                        sample_rate
+                    )
+                time, amp_arr = arrays
+                wf_arrays.append((time, amp_arr))
+                wfs_to_export.append(prep_wf_for_export(
+                    name, time, amp_arr, wf_type, freq, amp, offset, duty_cycle
+                ))
+
+            # Collect envelope data if enabled
+            envs_to_export = []
+            if any(env_flags) and wf_arrays:
+                time, max_env, min_env, rms_env = compute_envs(
+                    wf_arrays, *env_flags
+                )
+                if max_env is not None:
+                    envs_to_export.append(("Max_Envelope", time, max_env))
+                if min_env is not None:
+                    envs_to_export.append(("Min_Envelope", time, min_env))
+                if rms_env is not None:
+                    envs_to_export.append(("RMS_Envelope", time, rms_env))
+
+            success, message = export_fn(
+                filename,
+                wfs_to_export,
+                envs_to_export if envs_to_export else None,
+                sample_rate,
+                dur
+            )
+        except Exception as e:
+            success, message = False, f"Export failed: {str(e)}"
+
+        self._export_results.put((success, message))
+
+    def _poll_export(self):
+        """Finish the export once the worker has queued its result."""
+        try:
+            success, message = self._export_results.get_nowait()
+        except queue.Empty:
+            self.after(EXPORT_POLL_MS, self._poll_export)
+            return
+        self._on_export_done(success, message)
+
+    def _on_export_done(self, success: bool, message: str):
+        """Show the export result and re-enable the export button."""
+        self.export_progress.stop()
+        self.export_progress.pack_forget()
+        self.export_btn.configure(state="normal")
         if success:
             self.export_status.configure(text=message, text_color=_theme["success"])
         else:
@@ -1500,187 +1712,536 @@ class WaveformApp(ctk.CTk):
     # === UI Update Methods ===
 
     def _update_all_plots(self):
-        """Regenerate and update all waveform plots."""
-        self.ax.clear()
+        """Regenerate and update all waveform plots.
 
-        # Configure axes
+        The axes are only rebuilt when ``self._structural_dirty`` is set
+        (waveform set, envelope, name or color changes); otherwise the
+        existing artists are refreshed in place and the labels, grid and
+        legend are kept.
+        """
+        # Skip no-op requests (re-selecting a type, re-checking a box)
+        sig = self._plot_sig()
+        if sig == self._last_plot_sig:
+            self._structural_dirty = False
+            return
+        self._last_plot_sig = sig
+
+        cleared = self._structural_dirty
+        if cleared:
+            self._rebuild_plot()
+        self._refresh_plot(cleared)
+
+    def _plot_sig(self) -> tuple:
+        """Return a tuple characterizing everything the plot shows.
+
+        Two equal signatures produce the same figure, so the update can
+        be skipped.
+        """
+        return (
+            app_state.duration, app_state.sample_rate,
+            self._plot_y_min, self._plot_y_max, self._plot_y_title,
+            app_state.show_max_env, app_state.show_min_env,
+            app_state.show_rms_env, app_state.hide_src_wfs,
+            # Interactive mode only changes the envelope glow
+            self._interactive_mode and bool(self._env_lines),
+            tuple(
+                (wf.id, wf.wf_type, wf.freq, wf.amp, wf.offset,
+                 wf.duty_cycle, wf.color, wf.display_name, wf.enabled)
+                for wf in app_state.wfs
+            )
+        )
+
+    def _rebuild_plot(self):
+        """Clear the axes and restore labels, grid and callbacks.
+
+        Drops all artist bookkeeping; _refresh_plot recreates the lines.
+        """
+        self.ax.clear()
         self.ax.set_xlabel("Time (s)")
         self.ax.set_ylabel(self._plot_y_title)
+        self.ax.grid(visible=True, alpha=0.3, color=_theme["separator"])
+        # ax.clear() drops axes callbacks, so reconnect each time
+        self.ax.callbacks.connect('ylim_changed', self._on_ylim_changed)
+        self._legend = None
+        # The canvas can't show more detail than its pixel width
+        self._display_points = max(
+            PLOT_MIN_POINTS, int(self.ax.bbox.width * PLOT_POINTS_PER_PX)
+        )
+        self._wf_lines = {}
+        self._env_lines = {}
+        self._p2p_fill = None
+        self._structural_dirty = False
+        self._enabled_snapshot = None
+
+    def _refresh_plot(self, cleared: bool):
+        """Update waveform and envelope artists with the current data.
+
+        Existing lines get new data via set_data(); missing ones are
+        created and stale ones removed.
+
+        Args:
+            cleared: True right after _rebuild_plot, so the legend is
+                rebuilt and the cursors recreated.
+        """
         self.ax.set_xlim(0, app_state.duration)
         self.ax.set_ylim(self._plot_y_min, self._plot_y_max)
-        self.ax.grid(visible=True, alpha=0.3, color=_theme["separator"])
+
+        if self._enabled_snapshot is None:
+            enabled_wfs = app_state.get_enabled_wfs()
+            self._cached_enabled_wfs = enabled_wfs
+            self._enabled_snapshot = [
+                (wf.id, wf.wf_type, wf.freq, wf.amp, wf.offset, wf.duty_cycle,
+                 wf.mpl_color, wf.display_name)
+                for wf in enabled_wfs
+            ]
 
         # Generate and plot enabled waveforms
+        dur = app_state.duration
+        sample_rate = app_state.sample_rate
+        plot_src = not app_state.hide_src_wfs
+        wf_lines = self._wf_lines
+        plotted_ids: set[int] = set()
         wf_data: list[Tuple[np.ndarray, np.ndarray]] = []
-        for wf in app_state.wfs:
-            if wf.enabled:
-                time, amp = gen_wf(
-                    wf.wf_type,
-                    wf.freq,
-                    wf.amp,
-                    wf.offset,
-                    wf.duty_cycle,
-                    app_state.duration,
-                    app_state.sample_rate
+        array_cache = self._wf_array_cache
+        n_out = self._display_points
+        for (wf_id, wf_type, freq, amp, offset, duty_cycle,
+             color, label) in self._enabled_snapshot:
+            # Reuse the arrays when only presentation (name, color,
+            # envelopes) changed; regenerate when a parameter did
+            key = (wf_type, freq, amp, offset, duty_cycle, dur, sample_rate)
+            cached = array_cache.get(wf_id)
+            if cached is None or cached[0] != key:
+                time, amp_arr = gen_wf(
+                    wf_type, freq, amp, offset, duty_cycle, dur, sample_rate
                 )
-                wf_data.append((time, amp))
-
-                # Only plot if not hiding source waveforms
-                if not app_state.hide_src_wfs:
-                    # Convert RGB tuple to matplotlib color format
-                    color = tuple(c / 255 for c in wf.color)
-                    self.ax.plot(
-                        time, amp, color=color,
-                        label=wf.display_name, linewidth=2
-                    )
-
-        # Cache waveform data for cursor proximity checks
-        self._cached_wf_data = wf_data
+                cached = None
+            else:
+                time, amp_arr = cached[1], cached[2]
+            if cached is None or cached[5] != n_out:
+                # The line gets a downsampled float32 copy; cursors and
+                # export keep full resolution
+                plot_x, plot_y = lttb_downsample(time, amp_arr, n_out)
+                plot_x = plot_x.astype(PLOT_DTYPE)
+                plot_y = plot_y.astype(PLOT_DTYPE)
+                cached = (key, time, amp_arr, plot_x, plot_y, n_out)
+                array_cache[wf_id] = cached
+            _, time, amp_arr, plot_x, plot_y, _ = cached
+            wf_data.append((time, amp_arr))
+
+            # Only plot if not hiding source waveforms
+            if plot_src:
+                line = wf_lines.get(wf_id)
+                if line is None:
+                    wf_lines[wf_id] = self.ax.plot(
+                        plot_x, plot_y, color=color, label=label, linewidth=2,
+                        rasterized=True
+                    )[0]
+                else:
+                    line.set_data(plot_x, plot_y)
+                plotted_ids.add(wf_id)
+
+        # Drop lines of waveforms that are no longer plotted
+        for wf_id in wf_lines.keys() - plotted_ids:
+            wf_lines.pop(wf_id).remove()
+
+        # Forget arrays of removed waveforms
+        for wf_id in array_cache.keys() - {wf.id for wf in app_state.wfs}:
+            del array_cache[wf_id]
+
+        # Stack the waveforms into one (waveforms x samples) float32 matrix
+        # for envelopes and cursor checks; restack only if an array changed
+        sources = [amp for _, amp in wf_data]
+        prev = self._cached_wf_srcs
+        if len(prev) != len(sources) or any(
+                a is not b for a, b in zip(prev, sources)):
+            self._cached_wf_srcs = sources
+            if wf_data:
+                time = wf_data[0][0]
+                self._cached_wf_x = time
+                ys = self._cached_wf_ys
+                if ys is not None and ys.shape == (len(sources), len(time)):
+                    # Same layout (e.g. a parameter drag): overwrite only
+                    # the changed rows instead of allocating a new matrix
+                    for row, old_src, src in zip(ys, prev, sources):
+                        if old_src is not src:
+                            row[:] = src
+                else:
+                    self._cached_wf_ys = np.stack(sources, dtype=PLOT_DTYPE)
+                self._cached_t0 = float(time[0])
+                self._cached_dt = (
+                    float(time[1] - time[0]) if len(time) > 1 else 0.0
+                )
+            else:
+                self._cached_wf_x = None
+                self._cached_wf_ys = None
 
         # Plot envelopes with glow effect
-        if app_state.can_show_envelopes() and wf_data:
-            self._plot_envelopes(wf_data)
+        self._plot_envelopes(bool(wf_data) and app_state.can_show_envelopes())
 
-        # Add legend if there are any lines
-        if self.ax.get_lines():
-            self.ax.legend(loc='upper right')
+        # Build the legend once per structural change; its handles are
+        # copies, so it stays valid when the data lines are replaced
+        if cleared and self.ax.get_lines():
+            self._build_legend()
 
-        # Redraw cursors (ax.clear removes them)
-        self._redraw_cursors()
+        # Refresh cursors and their value readouts
+        self._redraw_cursors(cleared)
 
-        # Redraw canvas
-        self.canvas.draw()
+        # Request a redraw; Tk coalesces repeated requests into one draw
+        self.canvas.draw_idle()
 
         # Update status bar
         self._update_status_bar()
 
-    def _plot_envelopes(self, wf_data: list) -> None:
-        """Plot all enabled envelope lines with glow effects and P2P fill."""
-        max_env_data = None
-        min_env_data = None
+    def _cached_envs(self) -> tuple:
+        """Return the envelopes of the cached waveform matrix.
 
-        if app_state.show_max_env:
-            max_env_data = compute_max_env(wf_data)
-            self._plot_glowing_line(
-                max_env_data[0], max_env_data[1],
-                _theme["success"], 'Max Envelope'
-            )
+        The result is reused while the same waveform arrays (by identity,
+        see _wf_array_cache) and envelope flags are requested, so cursor
+        moves and name, color and theme changes don't recompute the
+        envelopes.
 
-        if app_state.show_min_env:
-            min_env_data = compute_min_env(wf_data)
-            self._plot_glowing_line(
-                min_env_data[0], min_env_data[1],
-                _theme["error"], 'Min Envelope'
-            )
+        Returns:
+            Tuple of (time, max_env, min_env, rms_env) as from compute_envs.
+        """
+        flags = (
+            app_state.show_max_env,
+            app_state.show_min_env,
+            app_state.show_rms_env
+        )
+        sources = self._cached_wf_srcs
+        cached = self._env_cache
+        if (cached is not None and cached[0] == flags
+                and cached[1] is sources):
+            return cached[2]
+        envs = compute_envs_stacked(
+            self._cached_wf_x, self._cached_wf_ys, *flags
+        )
+        self._env_cache = (flags, sources, envs)
+        return envs
 
-        # Peak-to-Peak fill between max and min
-        if max_env_data is not None and min_env_data is not None:
-            self.ax.fill_between(
-                max_env_data[0], min_env_data[1], max_env_data[1],
-                alpha=0.12, color=_theme["p2p_fill"], label="Peak-to-Peak"
-            )
+    def _display_envs(self, envs: tuple) -> tuple:
+        """Downsample envelopes to the display point count.
 
-        if app_state.show_rms_env:
-            time_rms, rms_env = compute_rms_env(wf_data)
-            self._plot_glowing_line(
-                time_rms, rms_env, _theme["rms"], 'RMS Envelope'
-            )
+        Max and min use min/max decimation on a shared x array, so they
+        keep every peak and the P2P fill can span them; RMS uses LTTB.
+        The last result is reused while envs and the point count match.
+
+        Args:
+            envs: (time, max_env, min_env, rms_env) from _cached_envs.
 
-    def _plot_glowing_line(self, x: Any, y: Any, color: str, label: str):
-        """Plot a line with a glow effect using layered transparency."""
-        for lw, alpha in zip(GLOW_LINEWIDTHS, GLOW_ALPHAS):
-            self.ax.plot(x, y, color=color, linewidth=lw, alpha=alpha)
-        self.ax.plot(
-            x, y, color=color, linewidth=GLOW_CORE_WIDTH,
-            alpha=1.0, label=label
+        Returns:
+            Tuple of (x, max_env, min_env, rms) where rms is an (x, y)
+            pair or None.
+        """
+        n_out = self._display_points
+        cached = self._env_display
+        if cached is not None and cached[0] is envs and cached[1] == n_out:
+            return cached[2]
+        time, max_env, min_env, rms_env = envs
+        band_x, min_env, max_env = band_downsample(
+            time, min_env, max_env, n_out
         )
+        rms = None
+        if rms_env is not None:
+            rms = lttb_downsample(time, rms_env, n_out)
+        result = (band_x, max_env, min_env, rms)
+        self._env_display = (envs, n_out, result)
+        return result
 
-    def _update_wf_list(self):
-        """Update the waveform list UI."""
-        # Clear existing widgets safely
-        children = list(self.wf_list_frame.winfo_children())
-        for widget in children:
-            try:
-                widget.destroy()
-            except Exception:
-                pass
+    def _plot_envelopes(self, show: bool) -> None:
+        """Plot all enabled envelope lines with glow effects and P2P fill.
+
+        Envelope lines that are no longer enabled are removed.
+
+        Args:
+            show: False if envelopes are not shown at all.
+        """
+        max_env = min_env = None
+        shown: set[str] = set()
+
+        if show:
+            time, max_env, min_env, rms = self._display_envs(self._cached_envs())
+            if max_env is not None:
+                self._plot_glowing_line(time, max_env, "success", 'Max Envelope')
+                shown.add("success")
+            if min_env is not None:
+                self._plot_glowing_line(time, min_env, "error", 'Min Envelope')
+                shown.add("error")
+            if rms is not None:
+                self._plot_glowing_line(*rms, "rms", 'RMS Envelope')
+                shown.add("rms")
+
+        for theme_key in self._env_lines.keys() - shown:
+            self._env_lines.pop(theme_key).remove()
+
+        # Peak-to-Peak fill between max and min; an existing polygon just
+        # gets new vertices (max forward, then min backward)
+        if max_env is not None and min_env is not None:
+            if self._p2p_fill is None:
+                self._p2p_fill = self.ax.fill_between(
+                    time, min_env, max_env,
+                    alpha=0.12, color=_theme["p2p_fill"], label="Peak-to-Peak"
+                )
+            else:
+                verts = np.concatenate((
+                    np.column_stack((time, max_env)),
+                    np.column_stack((time[::-1], min_env[::-1]))
+                ))
+                self._p2p_fill.set_verts([verts])
+        elif self._p2p_fill is not None:
+            self._p2p_fill.remove()
+            self._p2p_fill = None
+
+    def _plot_glowing_line(self, x: Any, y: Any, theme_key: str, label: str):
+        """Plot a line with a glow effect using layered transparency.
+
+        The glow is drawn as wide translucent path-effect strokes under
+        the line itself, so each envelope is a single artist. It is kept
+        in self._env_lines and reused with set_data() on later updates.
+        While parameters are being adjusted only the core line is drawn.
+
+        Args:
+            x: X data.
+            y: Y data.
+            theme_key: _theme key of the line color; also the cache key.
+            label: Legend label for the line.
+        """
+        effects = _GLOW_EFFECTS if not self._interactive_mode else []
+        line = self._env_lines.get(theme_key)
+        if line is not None:
+            line.set_data(x, y)
+            if line.get_path_effects() != effects:
+                line.set_path_effects(effects)
+            return
+
+        line, = self.ax.plot(
+            x, y, color=_theme[theme_key], linewidth=GLOW_CORE_WIDTH,
+            alpha=1.0, label=label, rasterized=True
+        )
+        line.set_path_effects(effects)
+        self._env_lines[theme_key] = line
+
+    def _build_legend(self):
+        """Create the plot legend from the labelled artists.
+
+        Legend handles copy their artist's path effects; the envelope
+        glow is stripped from them so the legend shows plain lines.
+        """
+        self._legend = self.ax.legend(loc='upper right')
+        for handle in self._legend.legend_handles:
+            if handle.get_path_effects():
+                handle.set_path_effects([])
 
-        self.wf_buttons = []
-        self.toggle_buttons = []
-        self.remove_buttons = []
+    def _update_wf_list(self):
+        """Update the waveform list UI.
 
+        Rows are kept per waveform id and only reconfigured; widgets are
+        created or destroyed only when waveforms are added or removed.
+        Nothing is touched if no displayed state changed since last call.
+        """
+        active_index = app_state.active_wf_index
+        remove_enabled = not app_state.hide_src_wfs
+        sig = (
+            _theme["ctk_mode"], active_index, remove_enabled,
+            tuple((wf.id, wf.display_name, wf.enabled) for wf in app_state.wfs)
+        )
+        if sig == self._last_wf_list_sig:
+            return
+        self._last_wf_list_sig = sig
+
+        rows = self._wf_rows
+        wf_ids = {wf.id for wf in app_state.wfs}
+        # Unmap the list while rows are created or destroyed so Tk lays
+        # it out once when it is re-packed, not once per row
+        resized = rows.keys() != wf_ids
+        if resized:
+            self.wf_list_frame.pack_forget()
+
+        # Drop rows of removed waveforms (ids are list positions)
+        for wf_id in rows.keys() - wf_ids:
+            rows.pop(wf_id)["row"].destroy()
+
+        styles = self._wf_row_styles()
+        show_remove = len(app_state.wfs) > app_state.MIN_WFS
         for wf in app_state.wfs:
-            row_frame = ctk.CTkFrame(self.wf_list_frame, fg_color="transparent")
-            row_frame.pack(fill="x", pady=SP_XS)
-
-            # Selection button (WinUI outlined style)
-            is_selected = wf.id == app_state.active_wf_index
-            fg_color = _theme["selected_bg"] if is_selected else "transparent"
-            border_color = (
-                _theme["selected_border"] if is_selected else _theme["border"]
-            )
-            border_width = 2 if is_selected else 1
-
-            wf_btn = ctk.CTkButton(
-                row_frame,
-                text=wf.display_name,
-                width=180,
-                fg_color=fg_color,
-                hover_color=_theme["selected_bg"],
-                border_color=border_color,
-                border_width=border_width,
-                text_color=_theme["text"],
-                corner_radius=RADIUS_SMALL,
-                font=self._font_body,
-                command=lambda wid=wf.id: self._on_select_wf(wid)
+            row = rows.get(wf.id)
+            if row is None:
+                row = self._create_wf_row(wf.id)
+                rows[wf.id] = row
+            self._apply_wf_row(row, wf, styles, show_remove, remove_enabled)
+
+        if resized:
+            self.wf_list_frame.pack(
+                after=self.add_wf_btn, fill="x", padx=SP_MD, pady=(0, SP_MD)
             )
-            wf_btn.pack(side="left", padx=(0, SP_XS))
-            self.wf_buttons.append(wf_btn)
 
-            # Right-click context menu for renaming
-            wf_btn.bind(
-                "<Button-3>",
-                lambda e, wid=wf.id: self._show_wf_context_menu(e, wid)
-            )
+        ordered = [rows[wf.id] for wf in app_state.wfs]
+        self.wf_buttons = [row["btn"] for row in ordered]
+        self.toggle_buttons = [row["vis"] for row in ordered]
+        self.remove_buttons = [
+            row["remove"] for row in ordered if row["remove"] is not None
+        ]
 
-            # Hover tooltip
-            wf_btn.bind("<Enter>", self._show_tooltip)
-            wf_btn.bind("<Leave>", self._hide_tooltip)
-
-            # Visibility toggle button
-            vis_text = "ON" if wf.enabled else "OFF"
-            vis_color = _theme["wf_on"] if wf.enabled else _theme["wf_off"]
-            vis_btn = ctk.CTkButton(
-                row_frame,
-                text=vis_text,
-                width=40,
-                fg_color=vis_color,
-                hover_color=_theme["wf_on"],
-                text_color="#FFFFFF",
-                corner_radius=RADIUS_SMALL,
-                font=self._font_caption,
-                command=lambda wid=wf.id: self._on_toggle_wf(wid)
-            )
-            vis_btn.pack(side="left", padx=SP_XS)
-            self.toggle_buttons.append(vis_btn)
-
-            # Remove button (only show if more than 1 waveform)
-            if len(app_state.wfs) > app_state.MIN_WFS:
-                is_enabled = not app_state.hide_src_wfs
-                remove_btn = ctk.CTkButton(
-                    row_frame,
-                    text="X",
-                    width=30,
-                    fg_color=_theme["remove_btn"] if is_enabled else _theme["wf_off"],
-                    hover_color=_theme["remove_btn"],
-                    state="normal" if is_enabled else "disabled",
-                    text_color="#FFFFFF",
-                    corner_radius=RADIUS_SMALL,
-                    font=self._font_caption,
-                    command=lambda wid=wf.id: self._on_remove_wf(wid)
-                )
-                remove_btn.pack(side="left", padx=SP_XS)
-                self.remove_buttons.append(remove_btn)
+    def _update_wf_rows(self, *wf_ids: int):
+        """Refresh only the given waveforms' list rows.
+
+        For single-row changes (visibility toggle, selection) that leave
+        the row set and remove-button state alone.
+
+        Args:
+            wf_ids: Ids of the waveforms whose rows to refresh.
+        """
+        styles = self._wf_row_styles()
+        show_remove = len(app_state.wfs) > app_state.MIN_WFS
+        remove_enabled = not app_state.hide_src_wfs
+        for wf_id in wf_ids:
+            row = self._wf_rows.get(wf_id)
+            wf = app_state.get_wf(wf_id)
+            if row is not None and wf is not None:
+                self._apply_wf_row(row, wf, styles, show_remove, remove_enabled)
+
+    def _wf_row_styles(self) -> dict[str, Any]:
+        """Return the list row button styles for the current theme.
+
+        Built once per theme and cached; each style table is keyed by
+        the state it renders.
+        """
+        theme_mode = _theme["ctk_mode"]
+        cached = self._wf_row_styles_cache
+        if cached is not None and cached[0] == theme_mode:
+            return cached[1]
+        selected_bg = _theme["selected_bg"]
+        text_color = _theme["text"]
+        wf_on = _theme["wf_on"]
+        wf_off = _theme["wf_off"]
+        remove_color = _theme["remove_btn"]
+        styles = {
+            "mode": theme_mode,
+            "btn": {  # keyed by "is selected" (WinUI outlined style)
+                True: {"fg_color": selected_bg, "hover_color": selected_bg,
+                       "border_color": _theme["selected_border"],
+                       "border_width": 2, "text_color": text_color},
+                False: {"fg_color": "transparent", "hover_color": selected_bg,
+                        "border_color": _theme["border"],
+                        "border_width": 1, "text_color": text_color},
+            },
+            "vis": {  # keyed by "is enabled"
+                True: {"text": "ON", "fg_color": wf_on, "hover_color": wf_on},
+                False: {"text": "OFF", "fg_color": wf_off, "hover_color": wf_on},
+            },
+            "remove": {  # keyed by "removal allowed"
+                True: {"fg_color": remove_color, "hover_color": remove_color,
+                       "state": "normal"},
+                False: {"fg_color": wf_off, "hover_color": remove_color,
+                        "state": "disabled"},
+            },
+        }
+        self._wf_row_styles_cache = (theme_mode, styles)
+        return styles
+
+    def _apply_wf_row(
+        self,
+        row: dict[str, Any],
+        wf: WfState,
+        styles: dict[str, Any],
+        show_remove: bool,
+        remove_enabled: bool
+    ):
+        """Configure one list row for a waveform, if its state changed.
+
+        Args:
+            row: Row dict from _create_wf_row.
+            wf: The waveform the row shows.
+            styles: Style tables from _wf_row_styles.
+            show_remove: Whether remove buttons are shown at all.
+            remove_enabled: Whether removing is currently allowed.
+        """
+        is_selected = wf.id == app_state.active_wf_index
+        row_state = (
+            styles["mode"], wf.display_name, is_selected, wf.enabled,
+            show_remove, remove_enabled
+        )
+        if row["state"] == row_state:
+            return
+        row["state"] = row_state
+
+        row["btn"].configure(text=wf.display_name, **styles["btn"][is_selected])
+        row["vis"].configure(**styles["vis"][wf.enabled])
+
+        # Remove button (only shown above the minimum waveform count)
+        remove_btn = row["remove"]
+        if show_remove:
+            if remove_btn is None:
+                remove_btn = self._create_wf_remove_btn(row["row"], wf.id)
+                row["remove"] = remove_btn
+            remove_btn.configure(**styles["remove"][remove_enabled])
+        elif remove_btn is not None:
+            remove_btn.destroy()
+            row["remove"] = None
+
+    def _create_wf_row(self, wf_id: int) -> dict[str, Any]:
+        """Create the widgets of one waveform list row.
+
+        Colors and texts are left to _update_wf_list.
+
+        Args:
+            wf_id: Waveform id (list position) the row's commands act on.
+
+        Returns:
+            Dict with the "row" frame and its "btn", "vis" and "remove"
+            buttons; "remove" is None until the remove button is shown.
+            "state" holds the last applied display state.
+        """
+        row_frame = ctk.CTkFrame(self.wf_list_frame, fg_color="transparent")
+        row_frame.pack(fill="x", pady=SP_XS)
+
+        wf_btn = ctk.CTkButton(
+            row_frame,
+            width=180,
+            corner_radius=RADIUS_SMALL,
+            font=self._font_body,
+            command=lambda: self._on_select_wf(wf_id)
+        )
+        wf_btn.pack(side="left", padx=(0, SP_XS))
+
+        # Right-click context menu for renaming
+        wf_btn.bind(
+            "<Button-3>",
+            lambda e: self._show_wf_context_menu(e, wf_id)
+        )
+
+        # Hover tooltip
+        wf_btn.bind("<Enter>", self._show_tooltip)
+        wf_btn.bind("<Leave>", self._hide_tooltip)
+
+        vis_btn = ctk.CTkButton(
+            row_frame,
+            width=40,
+            text_color="#FFFFFF",
+            corner_radius=RADIUS_SMALL,
+            font=self._font_caption,
+            command=lambda: self._on_toggle_wf(wf_id)
+        )
+        vis_btn.pack(side="left", padx=SP_XS)
+
+        return {
+            "row": row_frame, "btn": wf_btn, "vis": vis_btn, "remove": None,
+            "state": None
+        }
+
+    def _create_wf_remove_btn(self, row_frame: ctk.CTkFrame, wf_id: int):
+        """Create and pack the remove button at the end of a list row."""
+        remove_btn = ctk.CTkButton(
+            row_frame,
+            text="X",
+            width=30,
+            text_color="#FFFFFF",
+            corner_radius=RADIUS_SMALL,
+            font=self._font_caption,
+            command=lambda: self._on_remove_wf(wf_id)
+        )
+        remove_btn.pack(side="left", padx=SP_XS)
+        return remove_btn
 
     def _update_wf_parameters(self):
         """Update waveform parameter inputs based on active waveform."""
@@ -1689,28 +2250,24 @@ class WaveformApp(ctk.CTk):
             return
 
         # Update entry fields
-        self.freq_entry.delete(0, "end")
-        self.freq_entry.insert(0, f"{wf.freq:.1f}")
+        self._set_entry_value(self.freq_entry, wf.freq)
 
-        self.amp_entry.delete(0, "end")
-        self.amp_entry.insert(0, f"{wf.amp:.1f}")
+        self._set_entry_value(self.amp_entry, wf.amp)
 
-        self.offset_entry.delete(0, "end")
-        self.offset_entry.insert(0, f"{wf.offset:.1f}")
+        self._set_entry_value(self.offset_entry, wf.offset)
 
-        self.duty_entry.delete(0, "end")
-        self.duty_entry.insert(0, f"{wf.duty_cycle:.1f}")
+        self._set_entry_value(self.duty_entry, wf.duty_cycle)
 
         self.wf_type_combo.set(wf.wf_type.capitalize())
 
         # Update button states
-        self._update_freq_btns()
-        self._update_amp_btns()
-        self._update_offset_btns()
-        self._update_duty_btns()
+        self._refresh_btn_states()
 
         # Show/hide duty cycle for square waves
         needs_duty = wf.wf_type.lower() == 'square'
+        if needs_duty == self._duty_visible:
+            return
+        self._duty_visible = needs_duty
         if needs_duty:
             self.duty_label.pack(
                 anchor="w", padx=SP_MD,
@@ -1724,48 +2281,154 @@ class WaveformApp(ctk.CTk):
             self.duty_label.pack_forget()
             self.duty_frame.pack_forget()
 
-    def _update_duration_btns(self):
-        """Update duration button states."""
-        at_min = app_state.duration <= DURATION_MIN
-        at_max = app_state.duration >= DURATION_MAX
-        self.duration_dec_btn.configure(state="disabled" if at_min else "normal")
-        self.duration_inc_btn.configure(state="disabled" if at_max else "normal")
+    def _set_btn_state(self, btn: ctk.CTkButton, state: str):
+        """Configure a button's state only if it differs from the cached one."""
+        if self._btn_state_cache.get(btn) == state:
+            return
+        self._btn_state_cache[btn] = state
+        btn.configure(state=state)
 
-    def _update_freq_btns(self):
-        """Update frequency button states."""
-        wf = app_state.get_active_wf()
-        if wf:
-            at_min = wf.freq <= FREQ_MIN
-            at_max = wf.freq >= FREQ_MAX
-            self.freq_dec_btn.configure(state="disabled" if at_min else "normal")
-            self.freq_inc_btn.configure(state="disabled" if at_max else "normal")
+    def _set_limit_btns(
+        self,
+        dec_btn: ctk.CTkButton,
+        inc_btn: ctk.CTkButton,
+        value: float,
+        lo: float,
+        hi: float
+    ):
+        """Disable the -/+ buttons of a parameter row at its bounds."""
+        self._set_btn_state(dec_btn, "disabled" if value <= lo else "normal")
+        self._set_btn_state(inc_btn, "disabled" if value >= hi else "normal")
+
+    def _adjust_param(
+        self,
+        value: float,
+        lo: float,
+        hi: float,
+        dec_btn: ctk.CTkButton,
+        inc_btn: ctk.CTkButton
+    ) -> float:
+        """Clamp a parameter value and update its -/+ button states.
 
-    def _update_amp_btns(self):
-        """Update amplitude button states."""
-        wf = app_state.get_active_wf()
-        if wf:
-            at_min = wf.amp <= AMP_MIN
-            at_max = wf.amp >= AMP_MAX
-            self.amp_dec_btn.configure(state="disabled" if at_min else "normal")
-            self.amp_inc_btn.configure(state="disabled" if at_max else "normal")
+        The bound checks from the clamp are reused for the button states,
+        so callers don't need a separate _refresh_btn_states pass.
 
-    def _update_offset_btns(self):
-        """Update offset button states."""
-        wf = app_state.get_active_wf()
-        if wf:
-            at_min = wf.offset <= OFFSET_MIN
-            at_max = wf.offset >= OFFSET_MAX
-            self.offset_dec_btn.configure(state="disabled" if at_min else "normal")
-            self.offset_inc_btn.configure(state="disabled" if at_max else "normal")
+        Args:
+            value: Requested parameter value.
+            lo: Lower bound.
+            hi: Upper bound.
+            dec_btn: The row's minus button.
+            inc_btn: The row's plus button.
+
+        Returns:
+            The clamped value.
+        """
+        at_min = value <= lo
+        at_max = value >= hi
+        if at_min:
+            value = lo
+        elif at_max:
+            value = hi
+        self._set_btn_state(dec_btn, "disabled" if at_min else "normal")
+        self._set_btn_state(inc_btn, "disabled" if at_max else "normal")
+        return value
+
+    def _sync_enabled_snapshot(self, wf: WfState):
+        """Update a waveform's entry in the enabled snapshot after a parameter edit.
+
+        Args:
+            wf: The edited waveform state.
+        """
+        snapshot = self._enabled_snapshot
+        if snapshot is None:
+            return
+        for i, entry in enumerate(snapshot):
+            if entry[0] == wf.id:
+                snapshot[i] = (
+                    wf.id, wf.wf_type, wf.freq, wf.amp, wf.offset,
+                    wf.duty_cycle, wf.mpl_color, wf.display_name
+                )
+                return
+
+    def _schedule_plot_update(self, throttle: bool = False):
+        """Request a plot update, coalescing requests made in quick succession.
+
+        Only one _update_all_plots call is scheduled at a time, so a held
+        button, rapid clicks or several handlers firing for one user action
+        within PLOT_UPDATE_MS cost a single replot.
+
+        Args:
+            throttle: Also keep replots at least PLOT_THROTTLE_MS apart.
+                Used by the -/+ buttons; a non-throttled request (e.g.
+                Enter in an entry) replaces a pending throttled one.
+        """
+        if self._plot_update_pending:
+            if throttle or not self._plot_update_throttled:
+                return
+            self.after_cancel(self._plot_update_after_id)
+        delay = PLOT_UPDATE_MS
+        if throttle:
+            elapsed_ms = (monotonic() - self._last_plot_ts) * 1000
+            delay = max(delay, int(PLOT_THROTTLE_MS - elapsed_ms))
+        self._plot_update_pending = True
+        self._plot_update_throttled = throttle
+        self._plot_update_after_id = self.after(delay, self._do_plot_update)
+
+    def _do_plot_update(self):
+        """Run the scheduled plot update."""
+        self._plot_update_pending = False
+        self._plot_update_after_id = None
+        self._last_plot_ts = monotonic()
+        self._update_all_plots()
+
+    def _enter_interactive(self):
+        """Mark a parameter edit in progress and drop glow until it settles.
+
+        Each call restarts the GLOW_RESUME_MS timer; when it fires,
+        _exit_interactive redraws once at full quality. Without envelope
+        lines there is no glow to drop, so nothing is done.
+        """
+        if not self._env_lines:
+            return
+        self._interactive_mode = True
+        if self._interactive_after_id is not None:
+            self.after_cancel(self._interactive_after_id)
+        self._interactive_after_id = self.after(
+            GLOW_RESUME_MS, self._exit_interactive
+        )
+
+    def _exit_interactive(self):
+        """Leave interactive mode and redraw with envelope glow."""
+        self._interactive_after_id = None
+        self._interactive_mode = False
+        self._schedule_plot_update()
+
+    def _refresh_btn_states(self):
+        """Update all parameter +/- button states for the active waveform."""
+        self._set_limit_btns(
+            self.duration_dec_btn, self.duration_inc_btn,
+            app_state.duration, DURATION_MIN, DURATION_MAX
+        )
 
-    def _update_duty_btns(self):
-        """Update duty cycle button states."""
         wf = app_state.get_active_wf()
-        if wf:
-            at_min = wf.duty_cycle <= DUTY_MIN
-            at_max = wf.duty_cycle >= DUTY_MAX
-            self.duty_dec_btn.configure(state="disabled" if at_min else "normal")
-            self.duty_inc_btn.configure(state="disabled" if at_max else "normal")
+        if not wf:
+            return
+        self._set_limit_btns(
+            self.freq_dec_btn, self.freq_inc_btn,
+            wf.freq, FREQ_MIN, FREQ_MAX
+        )
+        self._set_limit_btns(
+            self.amp_dec_btn, self.amp_inc_btn,
+            wf.amp, AMP_MIN, AMP_MAX
+        )
+        self._set_limit_btns(
+            self.offset_dec_btn, self.offset_inc_btn,
+            wf.offset, OFFSET_MIN, OFFSET_MAX
+        )
+        self._set_limit_btns(
+            self.duty_dec_btn, self.duty_inc_btn,
+            wf.duty_cycle, DUTY_MIN, DUTY_MAX
+        )
 
     def _update_env_controls(self):
         """Enable/disable envelope checkboxes based on number of enabled waveforms."""
@@ -1811,22 +2474,53 @@ class WaveformApp(ctk.CTk):
     # === Cursor Methods ===
 
     def _on_mouse_move(self, event: Any):
+        """Queue a mouse motion event for the live cursor.
+
+        Motion events can arrive hundreds of times per second; only the
+        most recent one is processed, at most once per CURSOR_UPDATE_MS.
+        """
+        pending = self._motion_event is not None
+        self._motion_event = event
+        if not pending:
+            self.after(CURSOR_UPDATE_MS, self._flush_motion)
+
+    def _flush_motion(self):
+        """Process the latest queued mouse motion event."""
+        event = self._motion_event
+        self._motion_event = None
+        if event is not None:
+            self._handle_mouse_move(event)
+
+    def _handle_mouse_move(self, event: Any):
         """Handle mouse movement over the plot for live cursor tracking."""
         if event.inaxes != self.ax:
             # Remove live cursor when mouse leaves plot
-            if self._live_cursor_vline and self._live_cursor_vline in self.ax.lines:
+            if self._live_cursor_vline is not None:
                 self._live_cursor_vline.remove()
                 self._live_cursor_vline = None
-            self._remove_highlight_marker()
-            if self._live_annotation is not None:
-                self._live_annotation.remove()
-                self._live_annotation = None
+            self._hide_live_readout()
             self._live_cursor_x = None
+            self._live_cursor_y = None
+            self._live_cursor_key = None
             self._highlighted_wf_name = None
-            self.canvas.draw_idle()
+            self._blit_live_cursor()
             return
 
+        # Nothing to update if the pointer has not moved in data space
+        if (event.xdata == self._live_cursor_x
+                and event.ydata == self._live_cursor_y):
+            return
         self._live_cursor_x = event.xdata
+        self._live_cursor_y = event.ydata
+
+        # Within the same sample and y step the nearest line and its
+        # readout are unchanged; just move the cursor line
+        key = (self._sample_index(event.xdata), round(event.ydata * 100))
+        if key == self._live_cursor_key and self._live_cursor_vline is not None:
+            self._live_cursor_vline.set_xdata([event.xdata, event.xdata])
+            self._blit_live_cursor()
+            return
+        self._live_cursor_key = key
 
         # Find nearest waveform for highlight
         nearest = self._find_nearest_wf(event.xdata, event.ydata)
@@ -1834,45 +2528,54 @@ class WaveformApp(ctk.CTk):
         cursor_alpha = 0.5
         cursor_width = 1
 
-        # Remove old live annotation
-        if self._live_annotation is not None:
-            self._live_annotation.remove()
-            self._live_annotation = None
-
         if nearest is not None:
             wf_name, wf_y, wf_color = nearest
             self._highlighted_wf_name = wf_name
             cursor_color = wf_color
             cursor_alpha = 0.8
             cursor_width = 1.5
-            # Update or create highlight marker dot
-            self._remove_highlight_marker()
-            self._highlight_marker = self.ax.plot(
-                event.xdata, wf_y, 'o',
-                color=wf_color, markersize=8,
-                markeredgecolor=_theme["text"], markeredgewidth=1.5,
-                zorder=10
-            )[0]
-            # Show live value annotation
-            self._live_annotation = self.ax.annotate(
-                f"{wf_name}\nt={event.xdata:.4f}s\ny={wf_y:.4f}",
-                xy=(event.xdata, wf_y),
-                xytext=(12, 12), textcoords='offset points',
-                fontsize=8, color=_theme["text"],
-                bbox={
-                    'boxstyle': 'round,pad=0.3',
-                    'facecolor': _theme["plot_bg"], 
-                    'edgecolor': wf_color,
-                    'alpha': 0.85
-                },
-                zorder=11
-            )
+            text = f"{wf_name}\nt={event.xdata:.4f}s\ny={wf_y:.4f}"
+            marker = self._highlight_marker
+            annotation = self._live_annotation
+            if marker is None or annotation is None:
+                # Highlight marker dot and live value annotation, created
+                # once and then moved; plot refreshes discard them
+                self._remove_highlight_marker()
+                if annotation is not None:
+                    annotation.remove()
+                self._highlight_marker = self.ax.plot(
+                    event.xdata, wf_y, 'o',
+                    color=wf_color, markersize=8,
+                    markeredgecolor=_theme["text"], markeredgewidth=1.5,
+                    zorder=10, animated=True
+                )[0]
+                self._live_annotation = self.ax.annotate(
+                    text,
+                    xy=(event.xdata, wf_y),
+                    xytext=(12, 12), textcoords='offset points',
+                    fontsize=8, color=_theme["text"],
+                    bbox={
+                        'boxstyle': 'round,pad=0.3',
+                        'facecolor': _theme["plot_bg"], 
+                        'edgecolor': wf_color,
+                        'alpha': 0.85
+                    },
+                    zorder=11, animated=True
+                )
+            else:
+                marker.set_data([event.xdata], [wf_y])
+                marker.set_color(wf_color)
+                marker.set_visible(True)
+                annotation.set_text(text)
+                annotation.xy = (event.xdata, wf_y)
+                annotation.get_bbox_patch().set_edgecolor(wf_color)
+                annotation.set_visible(True)
         else:
             self._highlighted_wf_name = None
-            self._remove_highlight_marker()
+            self._hide_live_readout()
 
         # Update or create live cursor line
-        if self._live_cursor_vline and self._live_cursor_vline in self.ax.lines:
+        if self._live_cursor_vline is not None:
             self._live_cursor_vline.set_xdata([event.xdata, event.xdata])
             self._live_cursor_vline.set_color(cursor_color)
             self._live_cursor_vline.set_alpha(cursor_alpha)
@@ -1880,10 +2583,45 @@ class WaveformApp(ctk.CTk):
         else:
             self._live_cursor_vline = self.ax.axvline(
                 event.xdata, color=cursor_color,
-                linestyle='-', linewidth=cursor_width, alpha=cursor_alpha
+                linestyle='-', linewidth=cursor_width, alpha=cursor_alpha,
+                animated=True
             )
 
-        self.canvas.draw_idle()
+        self._blit_live_cursor()
+
+    def _connect_canvas_events(self):
+        """Connect cursor and draw callbacks to the current canvas."""
+        self._plot_bg = None
+        self.canvas.mpl_connect('motion_notify_event', self._on_mouse_move)
+        self.canvas.mpl_connect('button_press_event', self._on_plot_click)
+        self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
+
+    def _on_canvas_draw(self, event: Any):
+        """Capture the freshly drawn plot and overlay the live cursor.
+
+        The live cursor artists are animated, so a full draw leaves them
+        out; the captured background lets mouse motion redraw just them.
+        """
+        self._plot_bg = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_live_cursor()
+
+    def _draw_live_cursor(self):
+        """Draw the animated live cursor artists onto the canvas."""
+        for artist in (
+            self._live_cursor_vline, self._highlight_marker,
+            self._live_annotation
+        ):
+            if artist is not None:
+                self.ax.draw_artist(artist)
+
+    def _blit_live_cursor(self):
+        """Redraw only the live cursor over the cached plot background."""
+        if self._plot_bg is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._plot_bg)
+        self._draw_live_cursor()
+        self.canvas.blit(self.fig.bbox)
 
     def _find_nearest_wf(
         self, x: float, y: float
@@ -1893,34 +2631,29 @@ class WaveformApp(ctk.CTk):
         Checks envelope lines when visible, individual waveforms otherwise.
         Returns (name, y_value, color_hex) or None if nothing is close.
         """
-        y_min, y_max = self.ax.get_ylim()
-        threshold = (y_max - y_min) * CURSOR_PROXIMITY_THRESHOLD
-
-        best_dist = threshold
+        best_dist = self._cursor_y_threshold
         best_result = None
 
         # Use cached waveform data from last plot update
-        wf_data = self._cached_wf_data
-        if not wf_data:
+        time = self._cached_wf_x
+        if time is None:
             return None
 
         # Check envelope lines when they're visible
-        if app_state.can_show_envelopes() and wf_data:
+        if app_state.can_show_envelopes():
+            _, max_env, min_env, rms_env = self._cached_envs()
             env_candidates: list[Tuple[str, float, str]] = []
 
-            if app_state.show_max_env:
-                _, max_env = compute_max_env(wf_data)
-                env_y = float(np.interp(x, wf_data[0][0], max_env))
+            if max_env is not None:
+                env_y = float(self._values_at(max_env, x))
                 env_candidates.append(("Max Envelope", env_y, _theme["success"]))
 
-            if app_state.show_min_env:
-                _, min_env = compute_min_env(wf_data)
-                env_y = float(np.interp(x, wf_data[0][0], min_env))
+            if min_env is not None:
+                env_y = float(self._values_at(min_env, x))
                 env_candidates.append(("Min Envelope", env_y, _theme["error"]))
 
-            if app_state.show_rms_env:
-                _, rms_env = compute_rms_env(wf_data)
-                env_y = float(np.interp(x, wf_data[0][0], rms_env))
+            if rms_env is not None:
+                env_y = float(self._values_at(rms_env, x))
                 env_candidates.append(("RMS Envelope", env_y, _theme["rms"]))
 
             for name, env_y, color in env_candidates:
@@ -1929,20 +2662,76 @@ class WaveformApp(ctk.CTk):
                     best_dist = dist
                     best_result = (name, env_y, color)
 
-        # Check individual waveforms when they're visible
+        # Check individual waveforms when they're visible, all at once
         if not app_state.hide_src_wfs:
-            for wf, (time, amp) in zip(
-                [w for w in app_state.wfs if w.enabled], wf_data
-            ):
-                wf_y = float(np.interp(x, time, amp))
-                dist = abs(y - wf_y)
-                if dist < best_dist:
-                    best_dist = dist
-                    color_hex = '#{:02x}{:02x}{:02x}'.format(*wf.color)
-                    best_result = (wf.display_name, wf_y, color_hex)
+            wf_ys = self._values_at(self._cached_wf_ys, x)
+            dists = np.abs(wf_ys - y)
+            i = int(dists.argmin())
+            if dists[i] < best_dist:
+                # Rows follow _cached_enabled_wfs, even while a structural
+                # replot is still pending
+                wf = self._cached_enabled_wfs[i]
+                best_result = (wf.display_name, float(wf_ys[i]), wf.hex_color)
 
         return best_result
 
+    def _on_ylim_changed(self, ax: Any):
+        """Recompute the cursor snap distance when the y-limits change.
+
+        Covers plot updates as well as toolbar pan/zoom, so mouse motion
+        never has to query the axes limits.
+        """
+        y_min, y_max = ax.get_ylim()
+        self._cursor_y_threshold = (y_max - y_min) * CURSOR_PROXIMITY_THRESHOLD
+
+    def _sample_index(self, x: float) -> Optional[int]:
+        """Return the index of the cached sample nearest to time x.
+
+        Args:
+            x: Time position on the plot.
+
+        Returns:
+            Sample index, or None if no waveform data is cached.
+        """
+        if self._cached_wf_x is None:
+            return None
+        if not self._cached_dt:
+            return 0
+        pos = round((x - self._cached_t0) / self._cached_dt)
+        return max(0, min(len(self._cached_wf_x) - 1, pos))
+
+    def _values_at(self, samples: np.ndarray, x: float) -> np.ndarray:
+        """Linearly interpolate samples on the cached time axis at time x.
+
+        Equivalent to np.interp, but since the time axis is uniform the
+        sample interval is computed from its start and step instead of
+        searched for.
+
+        Args:
+            samples: One waveform or envelope, or a stack of them (one
+                per row), sampled on _cached_wf_x.
+            x: Time position on the plot.
+
+        Returns:
+            The value at x, or one value per row for a stack.
+        """
+        n = samples.shape[-1]
+        pos = (x - self._cached_t0) / self._cached_dt if n > 1 else 0.0
+        if pos <= 0:
+            return samples[..., 0]
+        if pos >= n - 1:
+            return samples[..., -1]
+        i = int(pos)
+        lo = samples[..., i]
+        return lo + (samples[..., i + 1] - lo) * (pos - i)
+
+    def _hide_live_readout(self):
+        """Hide the highlight marker and live annotation for later reuse."""
+        if self._highlight_marker is not None:
+            self._highlight_marker.set_visible(False)
+        if self._live_annotation is not None:
+            self._live_annotation.set_visible(False)
+
     def _remove_highlight_marker(self):
         """Remove the highlight dot from the plot."""
         if self._highlight_marker is not None:
@@ -1964,8 +2753,8 @@ class WaveformApp(ctk.CTk):
         Returns:
             The matplotlib annotation artist, or None if no data.
         """
-        wf_data = self._cached_wf_data
-        if not wf_data:
+        time = self._cached_wf_x
+        if time is None:
             return None
 
         lines: list[str] = [f"t = {x:.4f} s"]
@@ -1973,25 +2762,21 @@ class WaveformApp(ctk.CTk):
 
         # Individual waveforms (when not hidden by envelopes)
         if not app_state.hide_src_wfs:
-            for wf, (time, amp) in zip(
-                [w for w in app_state.wfs if w.enabled], wf_data
-            ):
-                val = float(np.interp(x, time, amp))
+            wf_values = self._values_at(self._cached_wf_ys, x)
+            for wf, val in zip(self._cached_enabled_wfs, wf_values):
                 lines.append(f"{wf.display_name}: {val:.4f}")
 
         # Envelopes
         if any_envelope:
-            if app_state.show_max_env:
-                _, env = compute_max_env(wf_data)
-                val = float(np.interp(x, wf_data[0][0], env))
+            _, max_env, min_env, rms_env = self._cached_envs()
+            if max_env is not None:
+                val = float(self._values_at(max_env, x))
                 lines.append(f"Max: {val:.4f}")
-            if app_state.show_min_env:
-                _, env = compute_min_env(wf_data)
-                val = float(np.interp(x, wf_data[0][0], env))
+            if min_env is not None:
+                val = float(self._values_at(min_env, x))
                 lines.append(f"Min: {val:.4f}")
-            if app_state.show_rms_env:
-                _, env = compute_rms_env(wf_data)
-                val = float(np.interp(x, wf_data[0][0], env))
+            if rms_env is not None:
+                val = float(self._values_at(rms_env, x))
                 lines.append(f"RMS: {val:.4f}")
 
         text = "\n".join(lines)
@@ -2023,7 +2808,7 @@ class WaveformApp(ctk.CTk):
             return
 
         # Remove old pinned cursor line and annotation
-        if self._pinned_cursor_vline and self._pinned_cursor_vline in self.ax.lines:
+        if self._pinned_cursor_vline is not None:
             self._pinned_cursor_vline.remove()
         if self._pinned_annotation is not None:
             self._pinned_annotation.remove()
@@ -2043,28 +2828,52 @@ class WaveformApp(ctk.CTk):
 
         self.canvas.draw_idle()
 
-    def _redraw_cursors(self):
-        """Re-draw cursor lines after ax.clear() and update readout."""
-        # ax.clear() already removed these, reset references
-        self._highlight_marker = None
-        self._pinned_annotation = None
-        self._live_annotation = None
+    def _redraw_cursors(self, cleared: bool):
+        """Refresh cursor lines and readouts after a plot update.
+
+        Args:
+            cleared: True if ax.clear() ran and removed the cursor artists.
+        """
+        if cleared:
+            # ax.clear() already removed these, reset references
+            self._pinned_cursor_vline = None
+            self._live_cursor_vline = None
+            self._highlight_marker = None
+            self._pinned_annotation = None
+            self._live_annotation = None
+        else:
+            # Cursor lines survive, but their value readouts are stale
+            self._remove_highlight_marker()
+            if self._pinned_annotation is not None:
+                self._pinned_annotation.remove()
+                self._pinned_annotation = None
+            if self._live_annotation is not None:
+                self._live_annotation.remove()
+                self._live_annotation = None
 
         # Redraw pinned cursor and annotation
         if self._pinned_cursor_x is not None:
-            self._pinned_cursor_vline = self.ax.axvline(
-                self._pinned_cursor_x, color=_theme["cursor_pinned"],
-                linestyle='--', linewidth=1, alpha=0.7
-            )
+            if self._pinned_cursor_vline is None:
+                self._pinned_cursor_vline = self.ax.axvline(
+                    self._pinned_cursor_x, color=_theme["cursor_pinned"],
+                    linestyle='--', linewidth=1, alpha=0.7
+                )
             self._pinned_annotation = self._create_cursor_annotation(
                 self._pinned_cursor_x, pinned=True
             )
         # Redraw live cursor (highlight recalculated on next mouse move)
+        self._live_cursor_y = None
+        self._live_cursor_key = None
         if self._live_cursor_x is not None:
-            self._live_cursor_vline = self.ax.axvline(
-                self._live_cursor_x, color=_theme["cursor_default"],
-                linestyle='-', linewidth=1, alpha=0.5
-            )
+            if self._live_cursor_vline is None:
+                self._live_cursor_vline = self.ax.axvline(
+                    self._live_cursor_x, color=_theme["cursor_default"],
+                    linestyle='-', linewidth=1, alpha=0.5, animated=True
+                )
+            else:
+                self._live_cursor_vline.set_color(_theme["cursor_default"])
+                self._live_cursor_vline.set_alpha(0.5)
+                self._live_cursor_vline.set_linewidth(1)
 
     def _update_status_bar(self):
         """Update status bar with current info."""
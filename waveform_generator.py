@@ -5,9 +5,109 @@ This module contains stateless functions for generating waveforms and envelopes.
 No UI or state management logic.
 """
 
+from functools import lru_cache
+
 import numpy as np
-from scipy import signal
-from typing import Tuple, List
+from typing import Tuple, List, Optional
+
+
+def _sine_kernel(
+    time: np.ndarray,
+    freq: float,
+    amp: float,
+    offset: float,
+    duty_cycle: float
+) -> np.ndarray:
+    """Evaluate a sine waveform on a time array (duty_cycle is ignored)."""
+    # Evaluate sin in place over the phase array: one allocation total
+    wf = (2 * np.pi * freq) * time
+    np.sin(wf, out=wf)
+    wf *= amp / 2
+    wf += offset
+    return wf
+
+
+def _square_kernel(
+    time: np.ndarray,
+    freq: float,
+    amp: float,
+    offset: float,
+    duty_cycle: float
+) -> np.ndarray:
+    """Evaluate a square waveform on a time array.
+
+    High for the first duty_cycle percent of each period, as with
+    scipy.signal.square.
+    """
+    wf = freq * time
+    np.mod(wf, 1.0, out=wf)  # Fraction of the current period
+    high = wf < duty_cycle / 100
+    half = amp / 2
+    # Write both levels into the phase buffer instead of a new array
+    wf.fill(offset - half)
+    np.copyto(wf, offset + half, where=high)
+    return wf
+
+
+def _sawtooth_kernel(
+    time: np.ndarray,
+    freq: float,
+    amp: float,
+    offset: float,
+    duty_cycle: float
+) -> np.ndarray:
+    """Evaluate a sawtooth waveform on a time array (duty_cycle is ignored).
+
+    Rises from offset - amp/2 to offset + amp/2 over each period, as
+    with scipy.signal.sawtooth.
+    """
+    wf = freq * time
+    np.mod(wf, 1.0, out=wf)
+    wf *= amp
+    wf += offset - amp / 2
+    return wf
+
+
+def _triangle_kernel(
+    time: np.ndarray,
+    freq: float,
+    amp: float,
+    offset: float,
+    duty_cycle: float
+) -> np.ndarray:
+    """Evaluate a triangle waveform on a time array (duty_cycle is ignored).
+
+    Starts at offset - amp/2 and peaks mid-period, as with
+    scipy.signal.sawtooth(width=0.5).
+    """
+    wf = freq * time
+    np.mod(wf, 1.0, out=wf)
+    wf -= 0.5
+    np.abs(wf, out=wf)
+    wf *= -2 * amp
+    wf += offset + amp / 2
+    return wf
+
+
+# Waveform type -> kernel dispatch table used by gen_wf
+_WF_KERNELS = {
+    "sine": _sine_kernel,
+    "square": _square_kernel,
+    "sawtooth": _sawtooth_kernel,
+    "triangle": _triangle_kernel,
+}
+
+
+@lru_cache(maxsize=8)
+def _time_axis(dur: float, sample_rate: int) -> np.ndarray:
+    """Return the sample time array for a duration and sample rate.
+
+    The array is cached and shared by every waveform with the same
+    duration and sample rate, so it is returned read-only.
+    """
+    time = np.linspace(0, dur, int(sample_rate * dur))
+    time.flags.writeable = False
+    return time
 
 
 def gen_sine_wf(
@@ -28,12 +128,11 @@ def gen_sine_wf(
         sample_rate: Samples per second
 
     Returns:
-        Tuple of (time array, amplitude array)
+        Tuple of (time array, amplitude array); the time array is shared
+        by all calls with the same dur and sample_rate and is read-only
     """
-    time = np.linspace(0, dur, int(sample_rate * dur))
-    half_amp = amp / 2
-    wf = offset + half_amp * np.sin(2 * np.pi * freq * time)
-    return time, wf
+    time = _time_axis(dur, sample_rate)
+    return time, _sine_kernel(time, freq, amp, offset, 50.0)
 
 
 def gen_square_wf(
@@ -56,15 +155,11 @@ def gen_square_wf(
         sample_rate: Samples per second
 
     Returns:
-        Tuple of (time array, amplitude array)
+        Tuple of (time array, amplitude array); the time array is shared
+        by all calls with the same dur and sample_rate and is read-only
     """
-    time = np.linspace(0, dur, int(sample_rate * dur))
-    half_amp = amp / 2
-    wf = offset + half_amp * signal.square(
-        2 * np.pi * freq * time,
-        duty=duty_cycle / 100
-    )
-    return time, wf
+    time = _time_axis(dur, sample_rate)
+    return time, _square_kernel(time, freq, amp, offset, duty_cycle)
 
 
 def gen_sawtooth_wf(
@@ -85,12 +180,11 @@ def gen_sawtooth_wf(
         sample_rate: Samples per second
 
     Returns:
-        Tuple of (time array, amplitude array)
+        Tuple of (time array, amplitude array); the time array is shared
+        by all calls with the same dur and sample_rate and is read-only
     """
-    time = np.linspace(0, dur, int(sample_rate * dur))
-    half_amp = amp / 2
-    wf = offset + half_amp * signal.sawtooth(2 * np.pi * freq * time)
-    return time, wf
+    time = _time_axis(dur, sample_rate)
+    return time, _sawtooth_kernel(time, freq, amp, offset, 50.0)
 
 
 def gen_triangle_wf(
@@ -111,15 +205,107 @@ def gen_triangle_wf(
         sample_rate: Samples per second
 
     Returns:
-        Tuple of (time array, amplitude array)
+        Tuple of (time array, amplitude array); the time array is shared
+        by all calls with the same dur and sample_rate and is read-only
     """
-    time = np.linspace(0, dur, int(sample_rate * dur))
-    half_amp = amp / 2
-    wf = offset + half_amp * signal.sawtooth(
-        2 * np.pi * freq * time,
-        width=0.5
-    )
-    return time, wf
+    time = _time_axis(dur, sample_rate)
+    return time, _triangle_kernel(time, freq, amp, offset, 50.0)
+
+
+def compute_envs(
+    wfs: List[Tuple[np.ndarray, np.ndarray]],
+    want_max: bool = True,
+    want_min: bool = True,
+    want_rms: bool = True
+) -> Tuple[
+    np.ndarray, Optional[np.ndarray], Optional[np.ndarray], Optional[np.ndarray]
+]:
+    """
+    Compute the requested envelopes in a single pass over the waveforms.
+
+    Each amplitude array is read once and folded into the max, min and
+    sum-of-squares buffers in place, instead of once per envelope.
+
+    Args:
+        wfs: List of (time, amplitude) tuples
+        want_max: Compute the maximum envelope
+        want_min: Compute the minimum envelope
+        want_rms: Compute the RMS envelope
+
+    Returns:
+        Tuple of (time array, max envelope, min envelope, RMS envelope);
+        envelopes that were not requested are None
+    """
+    if not wfs:
+        return (
+            np.array([]),
+            np.array([]) if want_max else None,
+            np.array([]) if want_min else None,
+            np.array([]) if want_rms else None,
+        )
+
+    time, first = wfs[0]  # Shared time base
+    max_env = first.copy() if want_max else None
+    min_env = first.copy() if want_min else None
+    rms_env = np.square(first) if want_rms else None
+    sq = np.empty_like(first) if want_rms else None
+
+    for _, amp in wfs[1:]:
+        if want_max:
+            np.maximum(max_env, amp, out=max_env)
+        if want_min:
+            np.minimum(min_env, amp, out=min_env)
+        if want_rms:
+            np.square(amp, out=sq)
+            rms_env += sq
+
+    if want_rms:
+        rms_env /= len(wfs)
+        np.sqrt(rms_env, out=rms_env)
+
+    return time, max_env, min_env, rms_env
+
+
+def compute_envs_stacked(
+    time: np.ndarray,
+    amps: np.ndarray,
+    want_max: bool = True,
+    want_min: bool = True,
+    want_rms: bool = True
+) -> Tuple[
+    np.ndarray, Optional[np.ndarray], Optional[np.ndarray], Optional[np.ndarray]
+]:
+    """
+    Compute the requested envelopes from a stacked amplitude matrix.
+
+    Same result as compute_envs, for callers that already hold the
+    amplitudes as one contiguous (waveforms x samples) array; each
+    envelope is a single reduction along axis 0.
+
+    Args:
+        time: Shared time array
+        amps: 2D array with one row of amplitudes per waveform
+        want_max: Compute the maximum envelope
+        want_min: Compute the minimum envelope
+        want_rms: Compute the RMS envelope
+
+    Returns:
+        Tuple of (time array, max envelope, min envelope, RMS envelope);
+        envelopes that were not requested are None
+    """
+    if len(amps) == 0:
+        return compute_envs([], want_max, want_min, want_rms)
+
+    max_env = amps.max(axis=0) if want_max else None
+    min_env = amps.min(axis=0) if want_min else None
+    rms_env = None
+    if want_rms:
+        # Row-wise sum of squares without a squared temporary
+        rms_env = np.einsum('ij,ij->j', amps, amps)
+        rms_env /= len(amps)
+        np.sqrt(rms_env, out=rms_env)
+
+    return time, max_env, min_env, rms_env
 
 
 def compute_max_env(
@@ -134,13 +320,7 @@ def compute_max_env(
     Returns:
         Tuple of (time array, max envelope array)
     """
-    if not wfs:
-        return np.array([]), np.array([])
-
-    time = wfs[0][0]  # Shared time base
-    amps = np.array([w[1] for w in wfs])
-    max_env = np.max(amps, axis=0)
-
+    time, max_env, _, _ = compute_envs(wfs, want_min=False, want_rms=False)
     return time, max_env
 
 
@@ -156,13 +336,7 @@ def compute_min_env(
     Returns:
         Tuple of (time array, min envelope array)
     """
-    if not wfs:
-        return np.array([]), np.array([])
-
-    time = wfs[0][0]  # Shared time base
-    amps = np.array([w[1] for w in wfs])
-    min_env = np.min(amps, axis=0)
-
+    time, _, min_env, _ = compute_envs(wfs, want_max=False, want_rms=False)
     return time, min_env
 
 
@@ -178,13 +352,7 @@ def compute_rms_env(
     Returns:
         Tuple of (time array, RMS envelope array)
     """
-    if not wfs:
-        return np.array([]), np.array([])
-
-    time = wfs[0][0]  # Shared time base
-    amps = np.array([w[1] for w in wfs])
-    rms_env = np.sqrt(np.mean(amps ** 2, axis=0))
-
+    time, _, _, rms_env = compute_envs(wfs, want_max=False, want_min=False)
     return time, rms_env
 
 
@@ -210,18 +378,102 @@ def gen_wf(
         sample_rate: Samples per second
 
     Returns:
-        Tuple of (time array, amplitude array)
-    """
-    wf_type = wf_type.lower()
-
-    if wf_type == "sine":
-        return gen_sine_wf(freq, amp, offset, dur, sample_rate)
-    elif wf_type == "square":
-        return gen_square_wf(freq, amp, duty_cycle, offset, dur, sample_rate)
-    elif wf_type == "sawtooth":
-        return gen_sawtooth_wf(freq, amp, offset, dur, sample_rate)
-    elif wf_type == "triangle":
-        return gen_triangle_wf(freq, amp, offset, dur, sample_rate)
-    else:
-        # Default to sine waveform
-        return gen_sine_wf(freq, amp, offset, dur, sample_rate)
+        Tuple of (time array, amplitude array); the time array is shared
+        by all calls with the same dur and sample_rate and is read-only
+    """
+    # Unrecognized types default to sine
+    kernel = _WF_KERNELS.get(wf_type.lower(), _sine_kernel)
+    time = _time_axis(dur, sample_rate)
+    return time, kernel(time, freq, amp, offset, duty_cycle)
+
+
+def lttb_downsample(
+    x: np.ndarray,
+    y: np.ndarray,
+    n_out: int = 2000
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Downsample a series for display with Largest-Triangle-Three-Buckets.
+
+    The first and last points are kept and the interior is split into
+    equal buckets. From each bucket, the point forming the largest triangle
+    with its neighbors is kept, which preserves peaks and edges.
+    The neighbors are the means of the previous and next buckets. Using the
+    previous bucket's mean instead of its selected point lets all buckets
+    be evaluated in one vectorized pass.
+
+    Args:
+        x: X values (monotonic)
+        y: Y values
+        n_out: Maximum number of output points (at least 3)
+
+    Returns:
+        Tuple of (x, y) arrays; the inputs unchanged if already short enough
+    """
+    n = len(x)
+    if n_out < 3 or n <= n_out:
+        return x, y
+
+    # Equal-size buckets over the interior points; the last bucket is
+    # padded by repeating the final interior index
+    interior = n - 2
+    bucket = -(-interior // (n_out - 2))
+    n_buckets = -(-interior // bucket)
+    idx = np.minimum(np.arange(1, n_buckets * bucket + 1), n - 2)
+    idx = idx.reshape(n_buckets, bucket)
+    bx = x[idx]
+    by = y[idx]
+
+    # Neighbor points: previous and next bucket means, anchored at the ends
+    mean_x = bx.mean(axis=1)
+    mean_y = by.mean(axis=1)
+    ax = np.concatenate(([x[0]], mean_x[:-1]))[:, None]
+    ay = np.concatenate(([y[0]], mean_y[:-1]))[:, None]
+    cx = np.concatenate((mean_x[1:], [x[-1]]))[:, None]
+    cy = np.concatenate((mean_y[1:], [y[-1]]))[:, None]
+
+    # Twice the triangle area (constant factor doesn't affect argmax)
+    area = np.abs((ax - cx) * (by - ay) - (ax - bx) * (cy - ay))
+    picked = idx[np.arange(n_buckets), area.argmax(axis=1)]
+
+    keep = np.concatenate(([0], picked, [n - 1]))
+    return x[keep], y[keep]
+
+
+def band_downsample(
+    x: np.ndarray,
+    lower: Optional[np.ndarray],
+    upper: Optional[np.ndarray],
+    n_out: int = 2000
+) -> Tuple[np.ndarray, Optional[np.ndarray], Optional[np.ndarray]]:
+    """
+    Downsample a lower/upper band for display with min/max decimation.
+
+    The samples are split into equal buckets; each bucket keeps the
+    minimum of lower and the maximum of upper at the bucket's first x,
+    so the band never shrinks. The last sample is appended so the band
+    spans the full x range. Both bounds share one x array, as a fill
+    between them requires.
+
+    Args:
+        x: X values (monotonic)
+        lower: Lower bound values, or None to skip
+        upper: Upper bound values, or None to skip
+        n_out: Maximum number of output points (at least 2)
+
+    Returns:
+        Tuple of (x, lower, upper); the inputs unchanged if already short
+        enough
+    """
+    n = len(x)
+    if n_out < 2 or n <= n_out:
+        return x, lower, upper
+
+    bucket = -(-n // (n_out - 1))
+    starts = np.arange(0, n, bucket)
+    band_x = np.append(x[starts], x[-1])
+    if lower is not None:
+        lower = np.append(np.minimum.reduceat(lower, starts), lower[-1])
+    if upper is not None:
+        upper = np.append(np.maximum.reduceat(upper, starts), upper[-1])
+    return band_x, lower, upper